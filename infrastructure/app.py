@@ -16,33 +16,37 @@
 """CDK app for slurm-factory infrastructure."""
 
 import os
-from aws_cdk import App, Environment
-from infrastructure.stacks import SlurmFactoryBinaryCache
 
-app = App()
+# Skip JS stack trace capture for every construct unless explicitly overridden.
+# Must be set before importing aws_cdk so the jsii kernel inherits it.
+os.environ.setdefault("CDK_DISABLE_STACK_TRACE", "1")
 
-# Get configuration from environment or context
-github_org = os.environ.get("CDK_GITHUB_ORG", "vantagecompute")
-github_repo = os.environ.get("CDK_GITHUB_REPO", "slurm-factory")
-domain_name = os.environ.get("CDK_DOMAIN_NAME", "slurm-factory-spack-binary-cache.vantagecompute.ai")
-hosted_zone_id = os.environ.get("CDK_HOSTED_ZONE_ID", "Z076740924E27W77EXSVN")
+from aws_cdk import App, Environment  # noqa: E402
+from infrastructure.stacks import SlurmFactoryBinaryCache  # noqa: E402
 
-# AWS environment
-account = os.environ.get("CDK_DEFAULT_ACCOUNT")
-region = os.environ.get("CDK_DEFAULT_REGION", "us-east-1")
+app = App()
 
-env = Environment(account=account, region=region) if account else None
+# Resolve the stack configuration from the environment once
+# Bind the lookup once instead of resolving os.environ.get for every key
+_getenv = os.environ.get
+stack_config = {
+    "github_org": _getenv("CDK_GITHUB_ORG", "vantagecompute"),
+    "github_repo": _getenv("CDK_GITHUB_REPO", "slurm-factory"),
+    "domain_name": _getenv("CDK_DOMAIN_NAME", "slurm-factory-spack-binary-cache.vantagecompute.ai"),
+    "hosted_zone_id": _getenv("CDK_HOSTED_ZONE_ID", "Z076740924E27W77EXSVN"),
+}
+
+# AWS environment - only bind the stack explicitly when an account is known
+account = _getenv("CDK_DEFAULT_ACCOUNT")
+if account:
+    stack_config["env"] = Environment(account=account, region=_getenv("CDK_DEFAULT_REGION", "us-east-1"))
 
 # Create the stack
 SlurmFactoryBinaryCache(
     app,
     "SlurmFactoryInfraStack",
-    github_org=github_org,
-    github_repo=github_repo,
-    domain_name=domain_name,
-    hosted_zone_id=hosted_zone_id,
-    env=env,
     description="Infrastructure for slurm-factory Spack binary cache",
+    **stack_config,
 )
 
 app.synth()
@@ -14,22 +14,95 @@
 
 """CLI for managing slurm-factory infrastructure."""
 
+import functools
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="infra",
     help="Manage slurm-factory infrastructure using AWS CDK",
     no_args_is_help=True,
 )
-console = Console()
+
+
+# Directory containing app.py and cdk.json
+_CDK_APP_DIR = Path(__file__).resolve().parent.parent
+# Default cloud assembly directory written by `cdk synth`
+_CDK_OUT = _CDK_APP_DIR / "cdk.out"
+
+
+def _cdk_out_is_fresh() -> bool:
+    """Return True if the cloud assembly is newer than every CDK app source file."""
+    manifest = _CDK_OUT / "manifest.json"
+    if not manifest.exists():
+        return False
+
+    sources = [_CDK_APP_DIR / "app.py", _CDK_APP_DIR / "cdk.json"]
+    sources.extend((_CDK_APP_DIR / "infrastructure").glob("*.py"))
+    newest_source = max(path.stat().st_mtime for path in sources if path.exists())
+    return manifest.stat().st_mtime > newest_source
+
+
+def _cdk_app_env(
+    github_org: str,
+    github_repo: str,
+    domain: str | None,
+    hosted_zone_id: str | None,
+) -> dict[str, str]:
+    """Return the subprocess environment with the CDK app configuration applied."""
+    overrides = {
+        "CDK_GITHUB_ORG": github_org,
+        "CDK_GITHUB_REPO": github_repo,
+    }
+    if domain:
+        overrides["CDK_DOMAIN_NAME"] = domain
+    if hosted_zone_id:
+        overrides["CDK_HOSTED_ZONE_ID"] = hosted_zone_id
+    return os.environ | overrides
+
+
+def _minify_templates(output_dir: Path) -> int:
+    """
+    Rewrite synthesized CloudFormation templates without whitespace.
+
+    Args:
+        output_dir: CDK cloud assembly directory containing *.template.json files
+
+    Returns:
+        Number of templates rewritten
+    """
+    import json
+
+    count = 0
+    for template_path in output_dir.glob("*.template.json"):
+        with template_path.open() as f:
+            template = json.load(f)
+        template_path.write_text(json.dumps(template, separators=(",", ":")))
+        count += 1
+    return count
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Create the shared console on first use so --help and completion skip rich setup."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _cdk_available() -> bool:
+    """Check once per process whether the AWS CDK CLI is on PATH without starting Node.js."""
+    return shutil.which("cdk") is not None
 
 
 def run_cdk_command(command: list[str], cwd: Path | None = None) -> int:
@@ -43,17 +116,12 @@ def run_cdk_command(command: list[str], cwd: Path | None = None) -> int:
     Returns:
         Exit code
     """
+    console = _console()
     if cwd is None:
-        cwd = Path(__file__).parent.parent
+        cwd = _CDK_APP_DIR
 
     # Ensure CDK is available
-    try:
-        subprocess.run(
-            ["cdk", "--version"],
-            capture_output=True,
-            check=True,
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not _cdk_available():
         console.print("[red]AWS CDK CLI not found. Install it with:[/red]")
         console.print("  npm install -g aws-cdk")
         return 1
@@ -80,6 +148,7 @@ def bootstrap(
     This creates the necessary CDK resources (S3 bucket, ECR repo, etc.)
     in your AWS account. Only needs to be run once per account/region.
     """
+    console = _console()
     console.print("[bold blue]Bootstrapping AWS CDK...[/bold blue]")
 
     cmd = ["cdk", "bootstrap"]
@@ -121,34 +190,35 @@ def synth(
         Path | None,
         typer.Option("--output", "-o", help="Output directory for CloudFormation templates"),
     ] = None,
+    minify: Annotated[
+        bool,
+        typer.Option("--minify/--no-minify", help="Strip whitespace from synthesized templates"),
+    ] = False,
 ) -> None:
     """
     Synthesize CloudFormation templates from CDK code.
 
     This generates the CloudFormation templates without deploying them.
     """
+    console = _console()
     console.print("[bold blue]Synthesizing CDK stack...[/bold blue]")
 
     # Set context variables
-    env_vars = os.environ.copy()
-    env_vars["CDK_GITHUB_ORG"] = github_org
-    env_vars["CDK_GITHUB_REPO"] = github_repo
-    
-    if domain:
-        env_vars["CDK_DOMAIN_NAME"] = domain
-    if hosted_zone_id:
-        env_vars["CDK_HOSTED_ZONE_ID"] = hosted_zone_id
+    env_vars = _cdk_app_env(github_org, github_repo, domain, hosted_zone_id)
 
     cmd = ["cdk", "synth"]
     
     if output:
         cmd.extend(["--output", str(output)])
 
-    cwd = Path(__file__).parent.parent
-    result = subprocess.run(cmd, cwd=cwd, env=env_vars)
+    result = subprocess.run(cmd, cwd=_CDK_APP_DIR, env=env_vars)
     
     if result.returncode == 0:
         console.print("[bold green]✓ Templates synthesized successfully[/bold green]")
+        if minify:
+            # Relative --output paths are resolved by cdk against the app directory
+            count = _minify_templates(_CDK_APP_DIR / (output or "cdk.out"))
+            console.print(f"[dim]Minified {count} template(s)[/dim]")
         if output:
             console.print(f"[dim]Output: {output}[/dim]")
     else:
@@ -192,17 +262,11 @@ def deploy(
 
     This creates or updates all resources defined in the CDK stack.
     """
+    console = _console()
     console.print("[bold blue]Deploying infrastructure...[/bold blue]")
 
     # Set context variables
-    env_vars = os.environ.copy()
-    env_vars["CDK_GITHUB_ORG"] = github_org
-    env_vars["CDK_GITHUB_REPO"] = github_repo
-    
-    if domain:
-        env_vars["CDK_DOMAIN_NAME"] = domain
-    if hosted_zone_id:
-        env_vars["CDK_HOSTED_ZONE_ID"] = hosted_zone_id
+    env_vars = _cdk_app_env(github_org, github_repo, domain, hosted_zone_id)
 
     cmd = ["cdk", "deploy"]
     
@@ -215,8 +279,7 @@ def deploy(
     if region:
         cmd.extend(["--region", region])
 
-    cwd = Path(__file__).parent.parent
-    result = subprocess.run(cmd, cwd=cwd, env=env_vars)
+    result = subprocess.run(cmd, cwd=_CDK_APP_DIR, env=env_vars)
     
     if result.returncode == 0:
         console.print("[bold green]✓ Infrastructure deployed successfully[/bold green]")
@@ -241,6 +304,7 @@ def destroy(
 
     WARNING: This will delete all resources, but the S3 bucket will be retained.
     """
+    console = _console()
     if not force:
         confirm = typer.confirm(
             "Are you sure you want to destroy the infrastructure?",
@@ -288,29 +352,39 @@ def diff(
         str | None,
         typer.Option("--profile", help="AWS profile to use"),
     ] = None,
+    reuse_synth: Annotated[
+        bool,
+        typer.Option(
+            "--reuse-synth",
+            help="Diff against the existing cdk.out if it is newer than the CDK sources",
+        ),
+    ] = False,
 ) -> None:
     """
     Show differences between deployed stack and current code.
+
+    With --reuse-synth, the templates from the last `infra synth` are used
+    instead of synthesizing again, so pass the same options used for synth.
     """
+    console = _console()
     console.print("[bold blue]Calculating diff...[/bold blue]")
 
     # Set context variables
-    env_vars = os.environ.copy()
-    env_vars["CDK_GITHUB_ORG"] = github_org
-    env_vars["CDK_GITHUB_REPO"] = github_repo
-    
-    if domain:
-        env_vars["CDK_DOMAIN_NAME"] = domain
-    if hosted_zone_id:
-        env_vars["CDK_HOSTED_ZONE_ID"] = hosted_zone_id
+    env_vars = _cdk_app_env(github_org, github_repo, domain, hosted_zone_id)
 
     cmd = ["cdk", "diff"]
-    
+
+    if reuse_synth:
+        if _cdk_out_is_fresh():
+            cmd.extend(["--app", str(_CDK_OUT)])
+            console.print(f"[dim]Reusing synthesized templates from {_CDK_OUT}[/dim]")
+        else:
+            console.print("[dim]cdk.out is missing or stale, synthesizing again[/dim]")
+
     if profile:
         cmd.extend(["--profile", profile])
 
-    cwd = Path(__file__).parent.parent
-    subprocess.run(cmd, cwd=cwd, env=env_vars)
+    subprocess.run(cmd, cwd=_CDK_APP_DIR, env=env_vars)
 
 
 @app.command()
@@ -323,6 +397,7 @@ def outputs(
     """
     Display stack outputs (bucket name, distribution URL, etc.).
     """
+    console = _console()
     console.print("[bold blue]Fetching stack outputs...[/bold blue]")
 
     cmd = [
@@ -335,7 +410,7 @@ def outputs(
         cmd.extend(["--profile", profile])
 
     result = subprocess.run(cmd, capture_output=True, text=True)
-    
+
     if result.returncode != 0:
         console.print("[red]Failed to fetch outputs. Is the stack deployed?[/red]")
         sys.exit(1)
@@ -343,7 +418,9 @@ def outputs(
     # Parse and display outputs
     import json
     outputs = json.loads(result.stdout)
-    
+
+    from rich.table import Table
+
     table = Table(title="Stack Outputs")
     table.add_column("Key", style="cyan")
     table.add_column("Value", style="green")
@@ -14,6 +14,7 @@
 
 """CDK Stacks for slurm-factory infrastructure."""
 
+import functools
 import hashlib
 
 from aws_cdk import (
@@ -25,12 +26,30 @@ from aws_cdk import (
     aws_cloudfront as cloudfront,
     aws_cloudfront_origins as origins,
     aws_iam as iam,
-    aws_certificatemanager as acm,
-    aws_route53 as route53,
-    aws_route53_targets as targets,
 )
 from constructs import Construct
 
+# S3 bucket name prefix; a per-account suffix keeps the name globally unique
+BUCKET_NAME_PREFIX = "slurm-factory-spack-buildcache"
+
+# Durations are created once at import rather than per stack instantiation
+NONCURRENT_VERSION_EXPIRATION = Duration.days(90)
+GITHUB_ACTIONS_MAX_SESSION = Duration.hours(4)  # 4 hours for long-running builds
+
+# GitHub Actions OIDC provider settings
+GITHUB_OIDC_HOST = "token.actions.githubusercontent.com"
+GITHUB_OIDC_AUDIENCE = "sts.amazonaws.com"
+GITHUB_OIDC_THUMBPRINTS = (
+    "6938fd4d98bab03faadb97b34396831e3780aea1",  # GitHub Actions thumbprint
+    "1c58a3a8518e8759bf075b76b750d4f2df264fcd",  # Backup thumbprint
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _account_hash(account: str) -> str:
+    """Return a deterministic 5-character suffix derived from the AWS account ID."""
+    return hashlib.md5(account.encode(), usedforsecurity=False).hexdigest()[:5]
+
 
 class SlurmFactoryBinaryCache(Stack):
     """Stack for Spack binary cache S3 bucket and CloudFront distribution."""
@@ -61,8 +80,8 @@ class SlurmFactoryBinaryCache(Stack):
 
         # Generate a deterministic 5-character suffix for bucket name uniqueness
         # Uses account ID to ensure consistency across deployments
-        account_hash = hashlib.md5(self.account.encode()).hexdigest()[:5]
-        bucket_name = f"slurm-factory-spack-buildcache-{account_hash}"
+        account_hash = _account_hash(self.account)
+        bucket_name = f"{BUCKET_NAME_PREFIX}-{account_hash}"
 
         # S3 Bucket for binary cache
         self.bucket = s3.Bucket(
@@ -79,7 +98,7 @@ class SlurmFactoryBinaryCache(Stack):
                 s3.LifecycleRule(
                     id="DeleteOldVersions",
                     enabled=True,
-                    noncurrent_version_expiration=Duration.days(90),
+                    noncurrent_version_expiration=NONCURRENT_VERSION_EXPIRATION,
                 ),
             ],
             cors=[
@@ -99,6 +118,10 @@ class SlurmFactoryBinaryCache(Stack):
             ],
         )
 
+        # Resolve bucket ARNs once; each property access is a jsii round-trip
+        bucket_arn = self.bucket.bucket_arn
+        bucket_objects_arn = f"{bucket_arn}/*"
+
         # Origin Access Control for CloudFront (newer than OAI)
         oac = cloudfront.S3OriginAccessControl(
             self,
@@ -106,7 +129,6 @@ class SlurmFactoryBinaryCache(Stack):
             signing=cloudfront.Signing.SIGV4_ALWAYS,
         )
 
-        # CloudFront distribution
         # Custom cache policy for buildcache - allow query strings and specific headers
         buildcache_cache_policy = cloudfront.CachePolicy(
             self,
@@ -145,8 +167,39 @@ class SlurmFactoryBinaryCache(Stack):
             ),
         )
         
-        distribution_props = {
-            "default_behavior": cloudfront.BehaviorOptions(
+        # Certificate for custom domain (if provided)
+        certificate = None
+        if domain_name and hosted_zone_id:
+            # Only load the DNS/ACM modules when a custom domain is configured
+            from aws_cdk import (
+                aws_certificatemanager as acm,
+                aws_route53 as route53,
+                aws_route53_targets as targets,
+            )
+
+            zone_name = ".".join(domain_name.rsplit(".", 2)[-2:])  # Extract base domain
+            record_name = domain_name.split(".", 1)[0]
+
+            hosted_zone = route53.HostedZone.from_hosted_zone_attributes(
+                self,
+                "HostedZone",
+                hosted_zone_id=hosted_zone_id,
+                zone_name=zone_name,
+            )
+
+            # Certificate must be in us-east-1 for CloudFront
+            certificate = acm.Certificate(
+                self,
+                "Certificate",
+                domain_name=domain_name,
+                validation=acm.CertificateValidation.from_dns(hosted_zone),
+            )
+
+        # CloudFront distribution
+        self.distribution = cloudfront.Distribution(
+            self,
+            "Distribution",
+            default_behavior=cloudfront.BehaviorOptions(
                 origin=origins.S3BucketOrigin(
                     self.bucket,
                     origin_access_control_id=oac.origin_access_control_id,
@@ -159,9 +212,9 @@ class SlurmFactoryBinaryCache(Stack):
                 allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD_OPTIONS,
                 cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD_OPTIONS,
             ),
-            "price_class": cloudfront.PriceClass.PRICE_CLASS_100,
-            "comment": "CDN for slurm-factory Spack binary cache",
-            "error_responses": [
+            price_class=cloudfront.PriceClass.PRICE_CLASS_100,
+            comment="CDN for slurm-factory Spack binary cache",
+            error_responses=[
                 # Return 404 for 403 errors (helps with missing files)
                 cloudfront.ErrorResponse(
                     http_status=403,
@@ -170,33 +223,12 @@ class SlurmFactoryBinaryCache(Stack):
                     ttl=Duration.seconds(10),
                 ),
             ],
-        }
-
-        # Certificate for custom domain (if provided)
-        certificate = None
-        if domain_name and hosted_zone_id:
-            hosted_zone = route53.HostedZone.from_hosted_zone_attributes(
-                self,
-                "HostedZone",
-                hosted_zone_id=hosted_zone_id,
-                zone_name=".".join(domain_name.split(".")[-2:]),  # Extract base domain
-            )
-
-            # Certificate must be in us-east-1 for CloudFront
-            certificate = acm.Certificate(
-                self,
-                "Certificate",
-                domain_name=domain_name,
-                validation=acm.CertificateValidation.from_dns(hosted_zone),
-            )
-
-            distribution_props["domain_names"] = [domain_name]
-            distribution_props["certificate"] = certificate
+            domain_names=[domain_name] if certificate else None,
+            certificate=certificate,
+        )
 
-        self.distribution = cloudfront.Distribution(
-            self,
-            "Distribution",
-            **distribution_props,
+        distribution_source_arn = (
+            f"arn:aws:cloudfront::{self.account}:distribution/{self.distribution.distribution_id}"
         )
 
         # Grant CloudFront OAC access to the bucket
@@ -207,10 +239,10 @@ class SlurmFactoryBinaryCache(Stack):
                 effect=iam.Effect.ALLOW,
                 principals=[iam.ServicePrincipal("cloudfront.amazonaws.com")],
                 actions=["s3:GetObject"],
-                resources=[f"{self.bucket.bucket_arn}/*"],
+                resources=[bucket_objects_arn],
                 conditions={
                     "StringEquals": {
-                        "AWS:SourceArn": f"arn:aws:cloudfront::{self.account}:distribution/{self.distribution.distribution_id}"
+                        "AWS:SourceArn": distribution_source_arn
                     }
                 },
             )
@@ -222,10 +254,10 @@ class SlurmFactoryBinaryCache(Stack):
                 effect=iam.Effect.ALLOW,
                 principals=[iam.ServicePrincipal("cloudfront.amazonaws.com")],
                 actions=["s3:ListBucket"],
-                resources=[self.bucket.bucket_arn],
+                resources=[bucket_arn],
                 conditions={
                     "StringEquals": {
-                        "AWS:SourceArn": f"arn:aws:cloudfront::{self.account}:distribution/{self.distribution.distribution_id}"
+                        "AWS:SourceArn": distribution_source_arn
                     }
                 },
             )
@@ -238,7 +270,7 @@ class SlurmFactoryBinaryCache(Stack):
                 self,
                 "AliasRecord",
                 zone=hosted_zone,
-                record_name=domain_name.split(".")[0],
+                record_name=record_name,
                 target=route53.RecordTarget.from_alias(
                     targets.CloudFrontTarget(self.distribution)
                 ),
@@ -248,7 +280,7 @@ class SlurmFactoryBinaryCache(Stack):
                 self,
                 "AliasRecordIPv6",
                 zone=hosted_zone,
-                record_name=domain_name.split(".")[0],
+                record_name=record_name,
                 target=route53.RecordTarget.from_alias(
                     targets.CloudFrontTarget(self.distribution)
                 ),
@@ -260,12 +292,9 @@ class SlurmFactoryBinaryCache(Stack):
         github_provider = iam.OpenIdConnectProvider(
             self,
             "GitHubOIDC",
-            url="https://token.actions.githubusercontent.com",
-            client_ids=["sts.amazonaws.com"],
-            thumbprints=[
-                "6938fd4d98bab03faadb97b34396831e3780aea1",  # GitHub Actions thumbprint
-                "1c58a3a8518e8759bf075b76b750d4f2df264fcd",  # Backup thumbprint
-            ],
+            url=f"https://{GITHUB_OIDC_HOST}",
+            client_ids=[GITHUB_OIDC_AUDIENCE],
+            thumbprints=list(GITHUB_OIDC_THUMBPRINTS),
         )
 
         # IAM Role for GitHub Actions
@@ -279,48 +308,25 @@ class SlurmFactoryBinaryCache(Stack):
                 federated=github_provider.open_id_connect_provider_arn,
                 conditions={
                     "StringLike": {
-                        "token.actions.githubusercontent.com:sub": github_repo_path,
+                        f"{GITHUB_OIDC_HOST}:sub": github_repo_path,
                     },
                     "StringEquals": {
-                        "token.actions.githubusercontent.com:aud": "sts.amazonaws.com",
+                        f"{GITHUB_OIDC_HOST}:aud": GITHUB_OIDC_AUDIENCE,
                     },
                 },
                 assume_role_action="sts:AssumeRoleWithWebIdentity",
             ),
             description=f"Role for GitHub Actions in {github_org}/{github_repo}",
-            max_session_duration=Duration.hours(4),  # 4 hours for long-running builds
+            max_session_duration=GITHUB_ACTIONS_MAX_SESSION,
         )
 
         # Grant GitHub Actions role permissions
+        # A single grant statement covers the bucket and its objects:
+        # s3:List* (ListBucket, ListBucketMultipartUploads, ListMultipartUploadParts),
+        # s3:GetBucket* (GetBucketLocation), s3:GetObject*, s3:PutObject,
+        # s3:DeleteObject* and s3:Abort* (AbortMultipartUpload)
         self.bucket.grant_read_write(self.github_actions_role)
 
-        # Additional permissions for GitHub Actions
-        self.github_actions_role.add_to_policy(
-            iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
-                actions=[
-                    "s3:ListBucket",
-                    "s3:GetBucketLocation",
-                    "s3:ListBucketMultipartUploads",
-                ],
-                resources=[self.bucket.bucket_arn],
-            )
-        )
-
-        self.github_actions_role.add_to_policy(
-            iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
-                actions=[
-                    "s3:PutObject",
-                    "s3:GetObject",
-                    "s3:DeleteObject",
-                    "s3:AbortMultipartUpload",
-                    "s3:ListMultipartUploadParts",
-                ],
-                resources=[f"{self.bucket.bucket_arn}/*"],
-            )
-        )
-
         # Outputs
         CfnOutput(
             self,
@@ -332,7 +338,7 @@ class SlurmFactoryBinaryCache(Stack):
         CfnOutput(
             self,
             "BucketArn",
-            value=self.bucket.bucket_arn,
+            value=bucket_arn,
             description="S3 bucket ARN",
         )
 
@@ -20,15 +20,22 @@ import tomllib
 from datetime import datetime
 from pathlib import Path
 
+_PROJECT_VERSION_RE = re.compile(rb'^\[project\][^\[]*?^version\s*=\s*"([^"]+)"', re.MULTILINE | re.DOTALL)
+_VERSION_LINE_RE = re.compile(rb'version: ".*"')
+_LAST_UPDATED_LINE_RE = re.compile(rb'lastUpdated: ".*"')
+
 
 def get_project_version() -> str:
     """Extract version from pyproject.toml"""
     pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
     
-    with open(pyproject_path, "rb") as f:
-        pyproject = tomllib.load(f)
+    data = pyproject_path.read_bytes()
+    match = _PROJECT_VERSION_RE.search(data)
+    if match:
+        return match.group(1).decode()
     
-    return pyproject["project"]["version"]
+    # Fall back to a full TOML parse for unusually formatted files
+    return tomllib.loads(data.decode())["project"]["version"]
 
 
 def update_version_yml(version: str) -> None:
@@ -36,27 +43,25 @@ def update_version_yml(version: str) -> None:
     version_file = Path(__file__).parent.parent / "docusaurus" / "data" / "version.yml"
     
     # Read current content
-    content = version_file.read_text()
-    
-    # Update version line
-    content = re.sub(
-        r'^version: ".*"$',
-        f'version: "{version}"',
-        content,
-        flags=re.MULTILINE
-    )
+    content = version_file.read_bytes()
     
-    # Update lastUpdated to today's date
+    # Update version and lastUpdated (today's date) in a single line sweep,
+    # keeping each line's original ending
     today = datetime.now().strftime("%Y-%m-%d")
-    content = re.sub(
-        r'^lastUpdated: ".*"$',
-        f'lastUpdated: "{today}"',
-        content,
-        flags=re.MULTILINE
-    )
+    replacements = {
+        _VERSION_LINE_RE: b'version: "%s"' % version.encode(),
+        _LAST_UPDATED_LINE_RE: b'lastUpdated: "%s"' % today.encode(),
+    }
+    lines = content.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        body = line.rstrip(b"\r\n")
+        for pattern, replacement in replacements.items():
+            if pattern.fullmatch(body):
+                lines[i] = replacement + line[len(body):]
+                break
     
     # Write updated content
-    version_file.write_text(content)
+    version_file.write_bytes(b"".join(lines))
     print(f"✓ Updated version to {version} in {version_file}")
 
 
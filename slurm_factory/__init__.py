@@ -28,25 +28,61 @@ Main modules:
 - utils: Docker operations and package creation utilities
 - exceptions: Custom exception hierarchy
 """
+import importlib
 import importlib.metadata
+from typing import TYPE_CHECKING
 
-from slurm_factory.config import Settings
-from slurm_factory.constants import SlurmVersion
-from slurm_factory.exceptions import (
-    SlurmFactoryError,
-    SlurmFactoryStreamExecError,
-    SlurmFactoryInstanceCreationError,
-)
-from slurm_factory.main import app
-from slurm_factory.spack_yaml import generate_spack_config, generate_yaml_string
+if TYPE_CHECKING:
+    from slurm_factory.config import Settings
+    from slurm_factory.constants import SlurmVersion
+    from slurm_factory.exceptions import (
+        SlurmFactoryError,
+        SlurmFactoryInstanceCreationError,
+        SlurmFactoryStreamExecError,
+    )
+    from slurm_factory.main import app
+    from slurm_factory.spack_yaml import generate_spack_config, generate_yaml_string
+
+    __version__: str
 
-try:
-    __version__ = importlib.metadata.version("slurm-factory")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.1.19"  # Fallback version for development
 __author__ = "Vantage Compute Corporation"
 __email__ = "info@vantagecompute.ai"
 
+# Public names are resolved on first access (PEP 562) so that importing the package,
+# e.g. for ``--version``, does not pull in typer/rich and the builder modules.
+_LAZY_ATTRS = {
+    "app": "slurm_factory.main",
+    "Settings": "slurm_factory.config",
+    "SlurmVersion": "slurm_factory.constants",
+    "generate_spack_config": "slurm_factory.spack_yaml",
+    "generate_yaml_string": "slurm_factory.spack_yaml",
+    "SlurmFactoryError": "slurm_factory.exceptions",
+    "SlurmFactoryStreamExecError": "slurm_factory.exceptions",
+    "SlurmFactoryInstanceCreationError": "slurm_factory.exceptions",
+}
+
+
+def __getattr__(name: str):
+    """Resolve public attributes lazily on first access."""
+    if name == "__version__":
+        try:
+            version = importlib.metadata.version("slurm-factory")
+        except importlib.metadata.PackageNotFoundError:
+            version = "0.1.19"  # Fallback version for development
+        globals()[name] = version
+        return version
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include lazily resolved attributes in dir() for tab-completion."""
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     # Main API
     "app",
@@ -11,13 +11,19 @@
 # limitations under the License.
 """Slurm build process management."""
 
+import functools
+import hashlib
+import io
 import logging
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import tarfile
 import textwrap
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rich.console import Console
@@ -34,7 +40,7 @@ from slurm_factory.constants import (
     CONTAINER_SPACK_PROJECT_DIR,
     CONTAINER_SPACK_STAGE_DIR,
     CONTAINER_SPACK_TEMPLATES_DIR,
-    DOCKER_COMMIT_TIMEOUT,
+    INSTANCE_NAME_PREFIX,
     S3_BUILDCACHE_BUCKET,
     SLURM_VERSIONS,
     SPACK_SETUP_SCRIPT,
@@ -43,6 +49,7 @@ from slurm_factory.exceptions import SlurmFactoryError, SlurmFactoryStreamExecEr
 from slurm_factory.spack_yaml import generate_yaml_string
 from slurm_factory.utils import (
     build_docker_image,
+    docker_image_exists,
     get_create_spack_profile_script,
     get_install_spack_script,
     remove_old_docker_image,
@@ -52,6 +59,8 @@ logger = logging.getLogger(__name__)
 console = Console()
 
 DOCKER_DNS_SERVERS = ("1.1.1.1", "8.8.8.8", "9.9.9.9")
+# Exit status reported when the Spack build step fails, as opposed to tarball packaging
+SPACK_BUILD_FAILED_EXIT_CODE = 90
 
 
 def _docker_dns_args() -> list[str]:
@@ -123,6 +132,26 @@ def _prepare_build_debug_bundle(
     return debug_dir
 
 
+def _iter_files_named(root: Path, names: set[str]) -> Iterator[Path]:
+    """
+    Yield regular files under root whose name is in names.
+
+    Uses os.scandir so file types come from the directory listing itself, avoiding a
+    stat per entry on Spack stage trees that can hold hundreds of thousands of files.
+    """
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.name in names and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
 def _collect_spack_failure_debug_bundle(spack_stage_dir: Path, debug_dir: Path) -> int:
     """Copy curated Spack failure logs into the stable debug bundle."""
     copied_files = 0
@@ -131,10 +160,7 @@ def _collect_spack_failure_debug_bundle(spack_stage_dir: Path, debug_dir: Path)
     if not spack_stage_dir.exists():
         return copied_files
 
-    for log_path in sorted(spack_stage_dir.rglob("*")):
-        if not log_path.is_file() or log_path.name not in log_names:
-            continue
-
+    for log_path in _iter_files_named(spack_stage_dir, log_names):
         if _copy_debug_bundle_file(
             log_path,
             debug_dir / "spack-stage" / log_path.relative_to(spack_stage_dir),
@@ -144,17 +170,18 @@ def _collect_spack_failure_debug_bundle(spack_stage_dir: Path, debug_dir: Path)
     return copied_files
 
 
-def get_module_template_content() -> str:
-    """Return the embedded Lmod module template content."""
+@functools.lru_cache(maxsize=1)
+def get_module_template_path() -> Path:
+    """Return the path of the Lmod module template shipped with slurm-factory."""
     # Try installed location first (share/slurm-factory/templates/)
     installed_path = Path(sys.prefix) / "share" / "slurm-factory" / "templates" / "relocatable_modulefile.lua"
     if installed_path.exists():
-        return installed_path.read_text()
+        return installed_path
 
     # Fall back to development location (project root data/templates/)
     dev_path = Path(__file__).parent.parent.parent / "data" / "templates" / "relocatable_modulefile.lua"
     if dev_path.exists():
-        return dev_path.read_text()
+        return dev_path
 
     raise FileNotFoundError(
         f"Could not find relocatable_modulefile.lua in installed location ({installed_path}) "
@@ -162,6 +189,12 @@ def get_module_template_content() -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
+def get_module_template_content() -> str:
+    """Return the embedded Lmod module template content (read once per process)."""
+    return get_module_template_path().read_text()
+
+
 def get_modulerc_creation_script(module_dir: str, modulerc_path: str) -> str:
     """
     Generate bash script to create the .modulerc.lua file.
@@ -184,12 +217,14 @@ def get_modulerc_creation_script(module_dir: str, modulerc_path: str) -> str:
     )
 
 
+@functools.lru_cache(maxsize=32)
 def get_slurm_build_script(
     toolchain: str,
     slurm_version: str,
     view_root: str = f"{CONTAINER_SLURM_DIR}/view",
     spack_stage_root: str = CONTAINER_SPACK_STAGE_DIR,
     lmod_root: str = f"{CONTAINER_SLURM_DIR}/modules-generated",
+    reuse_binaries: bool = False,
 ) -> str:
     """
     Generate script to build Slurm with Spack using the OS-provided system compiler.
@@ -204,6 +239,8 @@ def get_slurm_build_script(
         view_root: Root directory for the Spack view created by this build
         spack_stage_root: Root directory for this build's Spack stage and temp files
         lmod_root: Root directory where Spack writes generated Lmod module files
+        reuse_binaries: Concretize against specs in the configured binary mirrors instead of
+            with --fresh, so dependencies can be installed from the buildcache
 
     Returns:
         Complete bash script for Slurm build using system compiler
@@ -213,6 +250,8 @@ def get_slurm_build_script(
     _, gcc_version, _, _, _ = COMPILER_TOOLCHAINS[toolchain]
     slurm_package_version = SLURM_VERSIONS[slurm_version]
     sanitize_modules_script = _get_sanitize_redistributable_module_script(f"{CONTAINER_SLURM_DIR}/modules")
+    # --fresh ignores buildcache specs, so drop it when a binary mirror should be reused
+    concretize_flags = "-f" if reuse_binaries else "-f --fresh"
 
     return textwrap.dedent(f"""\
         mkdir -p {spack_stage_root}/tmp
@@ -280,7 +319,7 @@ def get_slurm_build_script(
         rm -f spack.lock
 
         echo '==> Concretizing Slurm packages with gcc@{gcc_version}...'
-        spack -e . concretize -j $(nproc) -f --fresh
+        spack -e . concretize -j $(nproc) {concretize_flags}
 
         # Clean up any stale locks before installation
         echo '==> Cleaning stale locks...'
@@ -326,6 +365,7 @@ def get_slurm_build_script(
     """).strip()
 
 
+@functools.lru_cache(maxsize=32)
 def get_create_slurm_tarball_script(
     modulerc_script: str,
     version: str,
@@ -358,26 +398,17 @@ def get_create_slurm_tarball_script(
         gpu_handling_script = textwrap.dedent(f"""\
             echo "DEBUG: Copying GPU libraries from Spack install tree..." && \\
             mkdir -p {view_root}/lib/gpu && \\
-            for lib in libnvidia-ml.so librocm_smi64.so librocm-core.so; do \\
-                find {install_tree_root} -name "$lib*" \\
-                    \\( -type f -o -type l \\) 2>/dev/null | while read -r libfile; do \\
-                    echo "DEBUG: Copying GPU library: $libfile" && \\
-                    cp -P "$libfile" {view_root}/lib/gpu/ || true; \\
-                done; \\
-            done && \\
+            {{ find {install_tree_root} \\( -type f -o -type l \\) \\
+                \\( -name 'libnvidia-ml.so*' -o -name 'librocm_smi64.so*' -o -name 'librocm-core.so*' \\) \\
+                -exec cp -Pv -t {view_root}/lib/gpu/ {{}} + 2>/dev/null || true; }} && \\
         """).strip()
 
     # Copy SSSD NSS module from system to view for LDAP/AD user lookups
     sssd_nss_script = textwrap.dedent(f"""\
         echo "DEBUG: Copying SSSD NSS libraries from system..." && \\
         mkdir -p {view_root}/lib/sssd && \\
-        for lib in libnss_sss.so; do \\
-            find /usr/lib /usr/lib64 /lib /lib64 -name "$lib*" \\
-                \\( -type f -o -type l \\) 2>/dev/null | while read -r libfile; do \\
-                echo "DEBUG: Copying SSSD library: $libfile" && \\
-                cp -P "$libfile" {view_root}/lib/sssd/ || true; \\
-            done; \\
-        done && \\
+        {{ find /usr/lib /usr/lib64 /lib /lib64 -name 'libnss_sss.so*' \\( -type f -o -type l \\) \\
+            -exec cp -Pv -t {view_root}/lib/sssd/ {{}} + 2>/dev/null || true; }} && \\
     """).strip()
 
     return textwrap.dedent(f"""\
@@ -401,15 +432,12 @@ def get_create_slurm_tarball_script(
         fi && \\
         echo "DEBUG: Packaging view directly (projections create FHS layout)..." && \\
         cd {view_root} && \\
-        {gpu_handling_script if gpu_handling_script else ""}{sssd_nss_script}find . -name "include" -type d \\
-            -exec rm -rf {{}} + 2>/dev/null || true && \\
-        find . -path "*/lib/pkgconfig" -type d -exec rm -rf {{}} + 2>/dev/null || true && \\
-        find . -path "*/share/doc" -type d -exec rm -rf {{}} + 2>/dev/null || true && \\
-        find . -path "*/share/man" -type d -exec rm -rf {{}} + 2>/dev/null || true && \\
-        find . -path "*/share/info" -type d -exec rm -rf {{}} + 2>/dev/null || true && \\
-        find . -name "__pycache__" -type d -exec rm -rf {{}} + 2>/dev/null || true && \\
-        find . -name "*.pyc" -delete 2>/dev/null || true && \\
-        find . -name "*.a" -delete 2>/dev/null || true && \\
+        {gpu_handling_script if gpu_handling_script else ""}{sssd_nss_script}find . \\
+            \\( -type d \\( -name "include" -o -path "*/lib/pkgconfig" \\
+            -o -path "*/share/doc" -o -path "*/share/man" -o -path "*/share/info" \\
+            -o -name "__pycache__" \\) -prune -exec rm -rf {{}} + \\) \\
+            -o \\( ! -type d \\( -name "*.pyc" -o -name "*.a" \\) -exec rm -f {{}} + \\) \\
+            2>/dev/null || true && \\
         echo "DEBUG: Configuring Pyxis SPANK plugin..." && \\
         if [ -f lib/slurm/spank_pyxis.so ]; then \\
             mkdir -p etc/slurm/plugstack.conf.d && \\
@@ -429,12 +457,48 @@ def get_create_slurm_tarball_script(
         {modulerc_script} && \\
         cd {view_parent} && \\
         mkdir -p {CONTAINER_SLURM_DIR}/redistributable && \\
-        tar -chzf {CONTAINER_SLURM_DIR}/redistributable/{tarball_base}.tar.gz {view_name} && \\
+        if command -v pigz >/dev/null 2>&1; then \\
+            tar -chf - {view_name} | pigz -p "$(nproc)" \\
+                > {CONTAINER_SLURM_DIR}/redistributable/{tarball_base}.tar.gz && \\
+            [ "${{PIPESTATUS[0]}}" -eq 0 ]; \\
+        else \\
+            tar -chzf {CONTAINER_SLURM_DIR}/redistributable/{tarball_base}.tar.gz {view_name}; \\
+        fi && \\
         mkdir -p {CONTAINER_BUILD_OUTPUT_DIR} && \\
         cp {CONTAINER_SLURM_DIR}/redistributable/{tarball_base}.tar.gz {CONTAINER_BUILD_OUTPUT_DIR}/
     """).strip()
 
 
+def _get_package_cache_mounts(operating_system: str) -> tuple[str, str]:
+    """
+    Return BuildKit cache mounts and package manager setup for the system deps RUN step.
+
+    Package downloads are kept in cache mounts that persist across builds even when the
+    layer cache misses, and never end up in the image layer.
+
+    Args:
+        operating_system: Operating system identifier from COMPILER_TOOLCHAINS
+
+    Returns:
+        Tuple of (RUN --mount flags, shell commands enabling the package cache)
+
+    """
+    if COMPILER_TOOLCHAINS[operating_system][3].startswith("ubuntu"):
+        mounts = (
+            f"--mount=type=cache,id=apt-cache-{operating_system},target=/var/cache/apt,sharing=locked "
+            f"--mount=type=cache,id=apt-lists-{operating_system},target=/var/lib/apt/lists,sharing=locked"
+        )
+        enable_cache = (
+            "rm -f /etc/apt/apt.conf.d/docker-clean\n"
+            "echo 'Binary::apt::APT::Keep-Downloaded-Packages \"true\";' > /etc/apt/apt.conf.d/keep-cache"
+        )
+    else:
+        mounts = f"--mount=type=cache,id=dnf-{operating_system},target=/var/cache/dnf,sharing=locked"
+        enable_cache = "grep -q '^keepcache=' /etc/dnf/dnf.conf || echo 'keepcache=1' >> /etc/dnf/dnf.conf"
+    return mounts, enable_cache
+
+
+@functools.lru_cache(maxsize=32)
 def _get_slurm_base_dockerfile(
     operating_system: str,
 ) -> str:
@@ -459,6 +523,8 @@ def _get_slurm_base_dockerfile(
     # Generate all script components
     install_deps_script = COMPILER_TOOLCHAINS[operating_system][4]
     container_image = COMPILER_TOOLCHAINS[operating_system][3]
+    package_cache_mounts, enable_package_cache = _get_package_cache_mounts(operating_system)
+    pip_cache_mount = f"--mount=type=cache,id=pip-{operating_system},target=/root/.cache/pip,sharing=locked"
 
     install_spack_script = get_install_spack_script()
     create_spack_profile_script = get_create_spack_profile_script()
@@ -467,8 +533,9 @@ def _get_slurm_base_dockerfile(
     install_spack_python_deps_script = textwrap.dedent(
         """\
         python_for_spack="${SPACK_PYTHON:-$(command -v python3)}" && \
-        PIP_BREAK_SYSTEM_PACKAGES=1 "$python_for_spack" -m pip install boto3 && \
-        "$python_for_spack" -c "import boto3"
+        PIP_BREAK_SYSTEM_PACKAGES=1 "$python_for_spack" -m pip install boto3 awscli && \
+        "$python_for_spack" -c "import boto3" && \
+        "$python_for_spack" -m awscli --version
     """
     ).strip()
     if operating_system == "resolute":
@@ -477,8 +544,9 @@ def _get_slurm_base_dockerfile(
             """\
             /usr/bin/python3.12 -m venv /opt/spack-python && \
             /opt/spack-python/bin/python -m pip install --upgrade pip && \
-            /opt/spack-python/bin/python -m pip install boto3 && \
-            /opt/spack-python/bin/python -c "import boto3"
+            /opt/spack-python/bin/python -m pip install boto3 awscli && \
+            /opt/spack-python/bin/python -c "import boto3" && \
+            /opt/spack-python/bin/python -m awscli --version
         """
         ).strip()
 
@@ -499,19 +567,26 @@ FROM {container_image}
 ENV DEBIAN_FRONTEND=noninteractive
 ENV TZ=UTC
 
-RUN bash << 'SETUP_EOF'
+# Layers are ordered from least to most frequently changed so edits to later
+# steps keep the expensive OS package layer cached.
+
+# Tier 1: OS build dependencies for the toolchain
+RUN {package_cache_mounts} {pip_cache_mount} bash << 'SETUP_EOF'
+{enable_package_cache}
 {install_deps_script}
 SETUP_EOF
 
-# Install Spack v1.0.0
+# Tier 2: Python packages for S3 buildcache access and tarball uploads{spack_python_env}
+RUN {pip_cache_mount} {install_spack_python_deps_script}
+
+# Tier 3: Spack v1.0.0 checkout and login profile
 RUN {install_spack_script}
 
 ENV SPACK_ROOT=/opt/spack
-ENV PATH=$SPACK_ROOT/bin:$PATH{spack_python_env}
-RUN {install_spack_python_deps_script}
+ENV PATH=$SPACK_ROOT/bin:$PATH
 RUN {create_spack_profile_script}
 
-# Create required directories including cache directories
+# Tier 4: Required directories including cache directories
 RUN mkdir -p \
     {CONTAINER_SPACK_PROJECT_DIR} \
     {CONTAINER_SPACK_TEMPLATES_DIR}/modules \
@@ -527,98 +602,162 @@ CMD ["/bin/bash"]
     )
 
 
-def _extract_slurm_tarball_from_image(
-    image_tag: str,
-    output_dir: str,
-    slurm_version: str,
-    toolchain: str,
-) -> None:
+def _get_base_image_tag(toolchain: str, dockerfile_content: str) -> str:
     """
-    Extract the Slurm package tarball from a packager Docker image.
-
-    Args:
-        image_tag: Tag of the packager Docker image
-        output_dir: Directory to extract the tarball to (will be appended with version/toolchain)
-        slurm_version: Slurm version (for finding the correct tarball)
-        toolchain: OS toolchain identifier used for the build
+    Return a stable tag for the base image built from the given Dockerfile.
 
+    The tag embeds a digest of the Dockerfile so builds of any Slurm version on the
+    same toolchain share one base image, and a changed Dockerfile yields a new tag.
     """
-    console.print(f"[bold blue]Extracting Slurm package from image {image_tag}...[/bold blue]")
+    digest = hashlib.sha256(dockerfile_content.encode()).hexdigest()[:12]
+    return f"{INSTANCE_NAME_PREFIX}:base-{toolchain}-{digest}"
 
-    # Create slurm_version-specific output directory: ~/.slurm-factory/slurm_version/toolchain/
-    base_path = Path(output_dir)
-    output_path = base_path / slurm_version / toolchain
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    logger.debug(f"Extracting package from image {image_tag} to {output_path}")
-
-    container_name = f"slurm-factory-extract-{slurm_version.replace('.', '-')}"
-
-    tarball_name = _get_slurm_tarball_name(slurm_version, toolchain)
-
-    container_tarball_path = f"/opt/slurm/build_output/{tarball_name}"
 
+@functools.lru_cache(maxsize=1)
+def _buildx_can_export_cache() -> bool:
+    """Return True if the active buildx builder can export a BuildKit cache."""
     try:
-        # Create a temporary container from the image
-        logger.debug(f"Creating temporary container {container_name}")
         result = subprocess.run(
-            ["docker", "create", "--name", container_name, image_tag],
+            ["docker", "buildx", "inspect"],
             capture_output=True,
             text=True,
             timeout=30,
         )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"Could not inspect the active buildx builder: {e}")
+        return False
+    if result.returncode != 0:
+        return False
+    # The default "docker" driver rejects registry/gha cache export; docker-container and
+    # other BuildKit-container drivers support it
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() == "Driver":
+            return value.strip() not in ("", "docker")
+    return False
 
-        if result.returncode != 0:
-            msg = f"Failed to create container for extraction: {result.stderr}"
-            logger.error(msg)
-            console.print(f"[bold red]{escape(msg)}[/bold red]")
-            raise SlurmFactoryError(msg)
 
-        # Copy the tarball from the container
-        logger.debug(f"Copying {container_tarball_path} from container to {output_path}")
-        console.print(f"[dim]Copying tarball to {output_path}...[/dim]")
+def _get_base_image_cache_specs(settings: Settings, toolchain: str) -> tuple[str | None, str | None]:
+    """
+    Get the shared BuildKit cache import/export specs for a toolchain's base image.
 
-        result = subprocess.run(
-            ["docker", "cp", f"{container_name}:{container_tarball_path}", str(output_path)],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+    A configured registry cache ref takes precedence. On GitHub Actions runners that expose
+    the cache service to the build step, the Actions cache is used instead. The cache is only
+    exported when the active buildx builder supports it; the default ``docker`` driver can
+    still import a registry cache but cannot use the Actions cache at all.
 
-        if result.returncode != 0:
-            msg = f"Failed to copy tarball from container: {result.stderr}"
-            logger.error(msg)
-            console.print(f"[bold red]{escape(msg)}[/bold red]")
-            raise SlurmFactoryError(msg)
+    Args:
+        settings: Application settings
+        toolchain: OS toolchain identifier
 
-        console.print(f"[bold green]✓ Extracted {tarball_name} to {output_path}[/bold green]")
-        logger.debug(f"Successfully extracted package to {output_path}/{tarball_name}")
+    Returns:
+        Tuple of (--cache-from spec, --cache-to spec), either None when unavailable
 
-    except subprocess.TimeoutExpired:
-        msg = "Extraction timed out"
-        logger.error(msg)
-        console.print(f"[bold red]{msg}[/bold red]")
-        raise SlurmFactoryError(msg)
-    except Exception as e:
-        msg = f"Failed to extract package: {e}"
+    """
+    if settings.docker_cache_ref:
+        cache = f"type=registry,ref={settings.docker_cache_ref}:base-{toolchain}"
+        can_import_without_export = True
+    elif os.environ.get("ACTIONS_CACHE_URL") and os.environ.get("ACTIONS_RUNTIME_TOKEN"):
+        cache = f"type=gha,scope=slurm-base-{toolchain}"
+        can_import_without_export = False
+    else:
+        return None, None
+
+    if _buildx_can_export_cache():
+        return cache, f"{cache},mode=max"
+    logger.debug("Active buildx builder cannot export a BuildKit cache, skipping --cache-to")
+    return (cache if can_import_without_export else None), None
+
+
+def _get_build_fingerprint(*inputs: str) -> str:
+    """Return a content hash over the inputs that determine a build's tarball."""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in inputs:
+        digest.update(value.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _get_aws_env() -> tuple[dict[str, str], Path | None]:
+    """
+    Collect the AWS credentials to pass into publishing containers.
+
+    Credentials from the environment (GitHub Actions OIDC or static keys set by the
+    configure-aws-credentials action) take precedence over the ~/.aws/ directory.
+
+    Returns:
+        Tuple of (environment variables to forward, ~/.aws/ directory to expose or None)
+
+    Raises:
+        SlurmFactoryError: If neither environment credentials nor ~/.aws/ are available
+
+    """
+    if "AWS_ACCESS_KEY_ID" in os.environ:
+        aws_env = {
+            key: os.environ[key]
+            for key in (
+                "AWS_ACCESS_KEY_ID",
+                "AWS_SECRET_ACCESS_KEY",
+                "AWS_SESSION_TOKEN",
+                "AWS_DEFAULT_REGION",
+                "AWS_REGION",
+            )
+            if key in os.environ
+        }
+        logger.debug("Using AWS credentials from environment")
+        return aws_env, None
+
+    aws_dir = Path.home() / ".aws"
+    if not aws_dir.exists():
+        msg = "AWS credentials not found. Set AWS_ACCESS_KEY_ID or configure ~/.aws/ credentials."
         logger.error(msg)
         console.print(f"[bold red]{escape(msg)}[/bold red]")
         raise SlurmFactoryError(msg)
-    finally:
-        # Clean up the temporary container
-        try:
-            subprocess.run(
-                ["docker", "rm", container_name],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            logger.debug(f"Removed temporary container {container_name}")
-        except Exception as e:
-            logger.warning(f"Failed to remove temporary container: {e}")
+    logger.debug("Using AWS credentials from ~/.aws/")
+    return {}, aws_dir
+
+
+def _copy_aws_dir_into_container(
+    container_name: str, aws_dir: Path, dest_dir: str, user: str | None = None
+) -> list[str]:
+    """
+    Copy the ~/.aws/ directory into a running container for a later ``docker exec``.
+
+    ``docker exec`` cannot add mounts, so the credentials are copied in with their host
+    ownership instead.
+
+    Args:
+        container_name: Name of the running container
+        aws_dir: Host ~/.aws/ directory
+        dest_dir: Scratch directory in the container to copy it under
+        user: Optional ``uid:gid`` to create the scratch directory as
+
+    Returns:
+        ``docker exec`` arguments pointing the AWS config and credentials files at the copy
+
+    """
+    subprocess.run(
+        ["docker", "exec", *(["--user", user] if user else []), container_name, "mkdir", "-p", dest_dir],
+        check=True,
+        capture_output=True,
+        timeout=30,
+    )
+    subprocess.run(
+        ["docker", "cp", "-a", str(aws_dir), f"{container_name}:{dest_dir}/aws"],
+        check=True,
+        capture_output=True,
+        timeout=30,
+    )
+    return [
+        "-e",
+        f"AWS_CONFIG_FILE={dest_dir}/aws/config",
+        "-e",
+        f"AWS_SHARED_CREDENTIALS_FILE={dest_dir}/aws/credentials",
+    ]
 
 
 def sign_and_push_tarball_to_buildcache(
+    container_name: str,
     tarball_path: Path,
     slurm_version: str,
     toolchain: str,
@@ -629,9 +768,11 @@ def sign_and_push_tarball_to_buildcache(
     """
     Sign a tarball with GPG and upload both tarball and signature to S3.
 
-    Creates a Docker container to handle GPG signing and S3 upload operations.
+    Signing and upload run via ``docker exec`` in the running build container, whose
+    base image already provides gpg and the AWS CLI, so no separate image is built.
 
     Args:
+        container_name: Name of the running build container that produced the tarball
         tarball_path: Path to the tarball file to sign and upload
         slurm_version: Slurm version (e.g., "25.11")
         toolchain: OS toolchain identifier (e.g., "noble")
@@ -651,26 +792,7 @@ def sign_and_push_tarball_to_buildcache(
         console.print(f"[bold red]{escape(msg)}[/bold red]")
         raise SlurmFactoryError(msg)
 
-    # Check for AWS credentials
-    aws_env = {}
-    if "AWS_ACCESS_KEY_ID" in os.environ:
-        aws_env["AWS_ACCESS_KEY_ID"] = os.environ["AWS_ACCESS_KEY_ID"]
-        aws_env["AWS_SECRET_ACCESS_KEY"] = os.environ["AWS_SECRET_ACCESS_KEY"]
-        if "AWS_SESSION_TOKEN" in os.environ:
-            aws_env["AWS_SESSION_TOKEN"] = os.environ["AWS_SESSION_TOKEN"]
-        if "AWS_DEFAULT_REGION" in os.environ:
-            aws_env["AWS_DEFAULT_REGION"] = os.environ["AWS_DEFAULT_REGION"]
-        if "AWS_REGION" in os.environ:
-            aws_env["AWS_REGION"] = os.environ["AWS_REGION"]
-        logger.debug("Using AWS credentials from environment")
-    else:
-        aws_dir = Path.home() / ".aws"
-        if not aws_dir.exists():
-            msg = "AWS credentials not found. Set AWS_ACCESS_KEY_ID or configure ~/.aws/"
-            logger.error(msg)
-            console.print(f"[bold red]{escape(msg)}[/bold red]")
-            raise SlurmFactoryError(msg)
-        logger.debug("Using AWS credentials from ~/.aws/")
+    aws_env, aws_dir = _get_aws_env()
 
     tarball_name = tarball_path.name
     # S3_BUILDCACHE_BUCKET already includes s3:// prefix
@@ -678,140 +800,85 @@ def sign_and_push_tarball_to_buildcache(
     s3_bucket_name = S3_BUILDCACHE_BUCKET.replace("s3://", "")
     architecture = _get_normalized_architecture()
     s3_base_path = f"{toolchain}/{slurm_version}/{architecture}"
+    # Scratch space for the keyring, signature and copied AWS config, removed by the script
+    sign_dir = f"/tmp/slurm-factory-sign-{_sanitize_build_namespace(container_name)}"
+
+    # Sign, upload and clean up in a single exec; the tarball is already in the
+    # container through the build output mount.
+    sign_script = textwrap.dedent(f"""
+        set -e
+        trap 'gpgconf --kill gpg-agent 2>/dev/null; rm -rf "$SIGN_DIR"' EXIT
+
+        TARBALL="{CONTAINER_BUILD_OUTPUT_DIR}/{tarball_name}"
+        S3_URL="s3://{s3_bucket_name}/{s3_base_path}"
+        mkdir -p "$SIGN_DIR/gnupg"
+        chmod 700 "$SIGN_DIR/gnupg"
+        export GNUPGHOME="$SIGN_DIR/gnupg"
+
+        echo "$GPG_PRIVATE_KEY" | base64 -d | \\
+            gpg --batch --yes --passphrase "$GPG_PASSPHRASE" \\
+                --pinentry-mode loopback --import
+
+        echo "🔐 Signing tarball with GPG key $GPG_KEY_ID..."
+        echo "$GPG_PASSPHRASE" | gpg --batch --yes --passphrase-fd 0 \\
+            --pinentry-mode loopback \\
+            --local-user "$GPG_KEY_ID" \\
+            --detach-sign \\
+            --armor \\
+            --output "$SIGN_DIR/{tarball_name}.asc" \\
+            "$TARBALL"
+
+        echo "✓ Tarball signed successfully"
+
+        AWS="${{SPACK_PYTHON:-python3}} -m awscli"
+        # Multipart settings go to a scratch config unless ~/.aws was copied in
+        export AWS_CONFIG_FILE="${{AWS_CONFIG_FILE:-$SIGN_DIR/aws/config}}"
+        $AWS configure set default.s3.max_concurrent_requests 20
+        $AWS configure set default.s3.multipart_chunksize 16MB
+
+        # The uploads are independent, so the signature goes up alongside the tarball
+        echo "📦 Uploading tarball and signature to S3..."
+        $AWS s3 cp --only-show-errors --no-progress "$TARBALL" "$S3_URL/{tarball_name}" &
+        TARBALL_PID=$!
+        $AWS s3 cp --only-show-errors --no-progress \\
+            "$SIGN_DIR/{tarball_name}.asc" "$S3_URL/{tarball_name}.asc" &
+        SIGNATURE_PID=$!
+        wait $TARBALL_PID
+        wait $SIGNATURE_PID
+
+        echo "✓ Tarball and signature uploaded successfully"
+        echo "✅ Tarball and signature published to $S3_URL/"
+    """).strip()
 
     try:
-        # Create temporary directory for Dockerfile
-        import tempfile
-
-        sign_dir = Path(tempfile.mkdtemp(prefix="slurm-factory-sign-"))
-        logger.debug(f"Created temporary signing directory: {sign_dir}")
-
-        # Create Dockerfile that handles signing and uploading in one container
-        dockerfile_content = textwrap.dedent("""
-            FROM ubuntu:26.04
-
-            RUN apt-get update && \\
-                apt-get install -y gnupg python3 python3-pip && \\
-                    apt-get clean -y && rm -rf /var/lib/apt/lists/* && \\
-                        python3 -m pip install awscli --break-system-packages
-
-            # Import GPG key
-            ARG GPG_PRIVATE_KEY
-            ARG GPG_PASSPHRASE
-            ARG GPG_KEY_ID
-
-            RUN echo "$GPG_PRIVATE_KEY" | base64 -d | \\
-                gpg --batch --yes --passphrase "$GPG_PASSPHRASE" \\
-                    --pinentry-mode loopback --import
-
-            WORKDIR /workspace
-
-            # Set up the entrypoint script
-            COPY entrypoint.sh /entrypoint.sh
-            RUN chmod +x /entrypoint.sh
-
-            ENTRYPOINT ["/entrypoint.sh"]
-        """).strip()
-
-        # Create entrypoint script that signs and uploads
-        entrypoint_content = textwrap.dedent(f"""
-            #!/bin/bash
-            set -e
-
-            TARBALL_NAME="{tarball_name}"
-            S3_BUCKET="{s3_bucket_name}"
-            S3_PATH="{s3_base_path}"
-
-            echo "🔐 Signing tarball with GPG key $GPG_KEY_ID..."
-            echo "$GPG_PASSPHRASE" | gpg --batch --yes --passphrase-fd 0 \\
-                --pinentry-mode loopback \\
-                --local-user "$GPG_KEY_ID" \\
-                --detach-sign \\
-                --armor \\
-                --output /workspace/$TARBALL_NAME.asc \\
-                /workspace/$TARBALL_NAME
-
-            echo "✓ Tarball signed successfully"
-
-            echo "📦 Uploading tarball to S3..."
-            aws s3 cp /workspace/$TARBALL_NAME \\
-                s3://$S3_BUCKET/$S3_PATH/$TARBALL_NAME
-
-            echo "✓ Tarball uploaded successfully"
-
-            echo "📦 Uploading signature to S3..."
-            aws s3 cp /workspace/$TARBALL_NAME.asc \\
-                s3://$S3_BUCKET/$S3_PATH/$TARBALL_NAME.asc
-
-            echo "✓ Signature uploaded successfully"
-            echo "✅ Tarball and signature published to s3://$S3_BUCKET/$S3_PATH/"
-        """).strip()
-
-        dockerfile_path = sign_dir / "Dockerfile.sign"
-        dockerfile_path.write_text(dockerfile_content)
-        entrypoint_path = sign_dir / "entrypoint.sh"
-        entrypoint_path.write_text(entrypoint_content)
-        logger.debug(f"Created Dockerfile at {dockerfile_path}")
-        logger.debug(f"Created entrypoint script at {entrypoint_path}")
-
-        # Build signing and upload image
-        console.print("[dim]Building GPG signing and upload container...[/dim]")
-        build_cmd = [
+        exec_cmd = [
             "docker",
-            "build",
-            "--build-arg",
+            "exec",
+            "-i",
+            "-e",
+            f"SIGN_DIR={sign_dir}",
+            "-e",
             f"GPG_PRIVATE_KEY={gpg_private_key}",
-            "--build-arg",
-            f"GPG_PASSPHRASE={gpg_passphrase}",
-            "--build-arg",
-            f"GPG_KEY_ID={gpg_key_id}",
-            "-f",
-            str(dockerfile_path),
-            "-t",
-            "tarball-signer-uploader",
-            str(sign_dir),
-        ]
-
-        result = subprocess.run(
-            build_cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
-
-        if result.returncode != 0:
-            msg = f"Failed to build signing container: {result.stderr}"
-            logger.error(msg)
-            console.print(f"[bold red]{escape(msg)}[/bold red]")
-            raise SlurmFactoryError(msg)
-
-        # Run signing and upload container
-        console.print(f"[dim]Signing tarball with GPG key {gpg_key_id} and uploading to S3...[/dim]")
-        # Build docker run command with environment variables
-        run_cmd = [
-            "docker",
-            "run",
-            "--rm",
-            *_docker_dns_args(),
-            "-v",
-            f"{tarball_path}:/workspace/{tarball_name}:ro",
             "-e",
             f"GPG_PASSPHRASE={gpg_passphrase}",
             "-e",
             f"GPG_KEY_ID={gpg_key_id}",
         ]
-        # Add AWS credentials to container
+        # Add AWS credentials to the exec environment
         for key, value in aws_env.items():
-            run_cmd.extend(["-e", f"{key}={value}"])
+            exec_cmd.extend(["-e", f"{key}={value}"])
 
-        # Mount AWS credentials directory if not using environment credentials
-        if "AWS_ACCESS_KEY_ID" not in aws_env:
-            run_cmd.extend(["-v", f"{Path.home() / '.aws'}:/root/.aws:ro"])
+        # The build container has no ~/.aws mount, so copy the config in when not using
+        # environment credentials
+        if aws_dir:
+            exec_cmd.extend(_copy_aws_dir_into_container(container_name, aws_dir, sign_dir))
 
-        run_cmd.append("tarball-signer-uploader")
+        exec_cmd.extend([container_name, "/bin/bash"])
 
+        console.print(f"[dim]Signing tarball with GPG key {gpg_key_id} and uploading to S3...[/dim]")
         result = subprocess.run(
-            run_cmd,
+            exec_cmd,
+            input=sign_script,
             capture_output=True,
             text=True,
             timeout=1800,  # 30 minutes for large uploads
@@ -826,19 +893,6 @@ def sign_and_push_tarball_to_buildcache(
         console.print(f"[bold green]{escape(result.stdout.strip())}[/bold green]")
         logger.debug(result.stdout)
 
-        # Cleanup Docker image
-        subprocess.run(
-            ["docker", "rmi", "tarball-signer-uploader"],
-            capture_output=True,
-            timeout=30,
-        )
-
-        # Cleanup temporary directory
-        import shutil
-
-        shutil.rmtree(sign_dir, ignore_errors=True)
-        logger.debug(f"Cleaned up temporary signing directory: {sign_dir}")
-
         console.print("[bold green]✓ Tarball and signature published successfully[/bold green]")
 
     except subprocess.TimeoutExpired:
@@ -854,7 +908,7 @@ def sign_and_push_tarball_to_buildcache(
 
 
 def _push_slurm_to_buildcache(
-    image_tag: str,
+    container_name: str,
     slurm_version: str,
     toolchain: str,
     signing_key: str | None = None,
@@ -869,14 +923,17 @@ def _push_slurm_to_buildcache(
     ``s3://{bucket}/{toolchain}/spack``.  When *local_cache* is set,
     also pushes unsigned packages to the local filesystem mirror.
 
+    The push runs via ``docker exec`` as the build user in the running build container,
+    which already has the Spack environment, install tree and local cache mount.
+
     Args:
-        image_tag: Tag of the build Docker image
+        container_name: Name of the running build container
         slurm_version: Slurm version
         toolchain: OS toolchain identifier
         signing_key: GPG key ID for signing packages (e.g., "0xKEYID")
         gpg_private_key: GPG private key (base64 encoded) to import into container
         gpg_passphrase: GPG key passphrase for non-interactive signing
-        local_cache: Host path to local filesystem buildcache (mounted into container)
+        local_cache: Host path to local filesystem buildcache (already mounted in the container)
 
     """
     console.print("[bold blue]Publishing to buildcache...[/bold blue]")
@@ -885,32 +942,7 @@ def _push_slurm_to_buildcache(
 
     logger.debug(f"Publishing Slurm {slurm_version} to {s3_mirror_url}")
 
-    # Check for AWS credentials - support both direct credentials and OIDC role
-
-    aws_env = {}
-
-    # Check for AWS credentials (GitHub Actions OIDC or static credentials)
-    # The configure-aws-credentials action sets these environment variables
-    if "AWS_ACCESS_KEY_ID" in os.environ:
-        # Use temporary credentials from configure-aws-credentials action
-        aws_env["AWS_ACCESS_KEY_ID"] = os.environ["AWS_ACCESS_KEY_ID"]
-        aws_env["AWS_SECRET_ACCESS_KEY"] = os.environ["AWS_SECRET_ACCESS_KEY"]
-        if "AWS_SESSION_TOKEN" in os.environ:
-            aws_env["AWS_SESSION_TOKEN"] = os.environ["AWS_SESSION_TOKEN"]
-        if "AWS_DEFAULT_REGION" in os.environ:
-            aws_env["AWS_DEFAULT_REGION"] = os.environ["AWS_DEFAULT_REGION"]
-        if "AWS_REGION" in os.environ:
-            aws_env["AWS_REGION"] = os.environ["AWS_REGION"]
-        logger.debug("Using AWS credentials from environment (GitHub Actions OIDC or configured credentials)")
-    else:
-        # Fall back to checking for credentials file
-        aws_dir = Path.home() / ".aws"
-        if not aws_dir.exists():
-            msg = "AWS credentials not found. Set AWS_ACCESS_KEY_ID or configure ~/.aws/ credentials."
-            logger.error(msg)
-            console.print(f"[bold red]{escape(msg)}[/bold red]")
-            raise SlurmFactoryError(msg)
-        logger.debug("Using AWS credentials from ~/.aws/")
+    aws_env, aws_dir = _get_aws_env()
 
     try:
         # Determine signing flags
@@ -921,51 +953,48 @@ def _push_slurm_to_buildcache(
             signing_flags = "--unsigned"
             logger.debug("Publishing unsigned packages")
 
+        # Without --force spack skips specs already in the mirror; their hashes pin the content.
+        # Indexes are rebuilt once after all pushes instead of per push.
         push_cmd = (
-            f"spack -e . buildcache push {signing_flags} --force --update-index "
+            f'spack -e . buildcache push -j "$(nproc)" {signing_flags} '
             "--with-build-dependencies s3-buildcache"
         )
 
         console.print(f"[dim]Pushing packages to {s3_mirror_url}...[/dim]")
-        # Build docker run command with AWS environment variables
-        cmd = ["docker", "run", "--rm", *_docker_dns_args()]
+        # Run as the build user so nothing root-owned lands in the host-mounted caches
+        build_user = f"{os.getuid()}:{os.getgid()}"
+        publish_dir = f"/tmp/slurm-factory-publish-{_sanitize_build_namespace(container_name)}"
+        # Build docker exec command with AWS environment variables
+        cmd = ["docker", "exec", "--user", build_user]
 
         # Add AWS environment variables
         for key, value in aws_env.items():
             cmd.extend(["-e", f"{key}={value}"])
 
+        # The key is only imported when packages are signed with it
+        import_signing_key = bool(gpg_private_key and signing_key)
+
         # If GPG private key is provided, pass it as an environment variable
-        if gpg_private_key:
+        if import_signing_key:
             cmd.extend(["-e", f"GPG_PRIVATE_KEY={gpg_private_key}"])
             logger.debug("GPG private key will be imported into container")
 
         # If GPG passphrase is provided, pass it as an environment variable
-        if gpg_passphrase:
+        if import_signing_key and gpg_passphrase:
             cmd.extend(["-e", f"GPG_PASSPHRASE={gpg_passphrase}"])
             logger.debug("GPG passphrase will be available in container")
 
-        # Mount AWS credentials directory if not using environment credentials
-        if "AWS_ACCESS_KEY_ID" not in aws_env:
-            cmd.extend(["-v", f"{Path.home() / '.aws'}:/root/.aws:ro"])
-
-        if local_cache:
-            cmd.extend(["-v", f"{local_cache}:{CONTAINER_LOCAL_BUILDCACHE_DIR}"])
+        # Copy AWS credentials directory in if not using environment credentials
+        if aws_dir:
+            cmd.extend(_copy_aws_dir_into_container(container_name, aws_dir, publish_dir, user=build_user))
 
         # Build the bash script to run in the container
         bash_script_parts = ["source /opt/spack/share/spack/setup-env.sh"]
 
         # If GPG private key is provided, import it before running buildcache commands
-        if gpg_private_key:
+        if import_signing_key:
             bash_script_parts.extend(
                 [
-                    # Ensure GPG is installed (Rocky Linux 10 and some distros don't have it by default)
-                    (
-                        "if ! command -v gpg &> /dev/null; then "
-                        "if command -v yum &> /dev/null; then yum install -y gnupg2; "
-                        "elif command -v apt-get &> /dev/null; then "
-                        "apt-get update && apt-get install -y gnupg; "
-                        "fi; fi"
-                    ),
                     # Ensure GPG home directory exists
                     "mkdir -p /opt/spack/opt/spack/gpg",
                     # Configure GPG with loopback pinentry BEFORE importing keys
@@ -976,16 +1005,20 @@ def _push_slurm_to_buildcache(
                     ),
                     # Store passphrase for GPG wrapper to use
                     'echo "${GPG_PASSPHRASE}" > /tmp/gpg-passphrase.txt',
-                    # Create GPG wrapper to inject passphrase when Spack calls gpg for signing
-                    "mv /usr/bin/gpg /usr/bin/gpg-real",
+                    # Create GPG wrapper to inject passphrase when Spack calls gpg for signing.
+                    # It shadows gpg on PATH for this script only, leaving /usr/bin/gpg alone
+                    # for anything else running in the build container.
+                    f"mkdir -p {publish_dir}/bin",
+                    f'ln -sf "$(command -v gpg)" {publish_dir}/bin/gpg-real',
                     (
                         r"""printf '#!/bin/bash\n# Wrapper to add passphrase for non-interactive signing\n"""
                         r"""if [[ "$*" == *"--clearsign"* ]] || [[ "$*" == *"--detach-sign"* ]]; then\n"""
-                        r"""  exec /usr/bin/gpg-real --pinentry-mode loopback """
+                        rf"""  exec {publish_dir}/bin/gpg-real --pinentry-mode loopback """
                         r"""--passphrase-file /tmp/gpg-passphrase.txt "$@"\n"""
-                        r"""else\n  exec /usr/bin/gpg-real "$@"\nfi\n' > /usr/bin/gpg"""
+                        rf"""else\n  exec {publish_dir}/bin/gpg-real "$@"\nfi\n' > {publish_dir}/bin/gpg"""
                     ),
-                    "chmod +x /usr/bin/gpg",
+                    f"chmod +x {publish_dir}/bin/gpg",
+                    f'export PATH="{publish_dir}/bin:$PATH"',
                     # Import GPG key using Spack's gpg trust command (imports to /opt/spack/opt/spack/gpg)
                     'echo "$GPG_PRIVATE_KEY" | base64 -d > /tmp/gpg-key.asc',
                     "spack gpg trust /tmp/gpg-key.asc",
@@ -1012,7 +1045,7 @@ def _push_slurm_to_buildcache(
             [
                 "cd /root/spack-project",
                 "spack env activate .",
-                f"spack mirror add --scope site s3-buildcache {s3_mirror_url}",
+                f"spack mirror add --scope user s3-buildcache {s3_mirror_url}",
                 push_cmd,
             ]
         )
@@ -1021,44 +1054,38 @@ def _push_slurm_to_buildcache(
             local_mirror_url = f"file://{CONTAINER_LOCAL_BUILDCACHE_DIR}"
             bash_script_parts.extend(
                 [
-                    f"spack mirror add --scope site local-buildcache {local_mirror_url}",
-                    "spack -e . buildcache push --unsigned --force --update-index "
+                    f"spack mirror add --scope user local-buildcache {local_mirror_url}",
+                    'spack -e . buildcache push -j "$(nproc)" --unsigned '
                     "--with-build-dependencies local-buildcache",
                 ]
             )
 
+        bash_script_parts.append("spack buildcache update-index s3-buildcache")
+        if local_cache:
+            bash_script_parts.append("spack buildcache update-index local-buildcache")
+
         # Join the script parts with &&
         bash_script = " && ".join(bash_script_parts)
 
-        # Add image and command
-        cmd.extend([image_tag, "bash", "-c", bash_script])
+        # Add container and command
+        cmd.extend([container_name, "bash", "-c", bash_script])
 
-        console.print(f"[dim]Running spack buildcache push in {image_tag} with AWS credentials[/dim]")
+        console.print(f"[dim]Running spack buildcache push in {container_name} with AWS credentials[/dim]")
         logger.debug(f"Running: {' '.join(cmd[:10])}...")
 
+        # Let the push output go straight to the terminal instead of buffering hours of it
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            check=False,
             timeout=7200,  # 120 minutes for large uploads
         )
 
         if result.returncode != 0:
-            msg = f"Failed to push to buildcache: {result.stderr}"
+            msg = f"Failed to push to buildcache: exit code {result.returncode}"
             logger.error(msg)
-            console.print(f"[dim]stdout: {escape(result.stdout)}[/dim]")
             console.print(f"[bold red]{escape(msg)}[/bold red]")
             raise SlurmFactoryError(msg)
 
-        # Always show buildcache push output for transparency
-        if result.stdout:
-            console.print(f"[dim]Buildcache push output:\n{escape(result.stdout)}[/dim]")
-        else:
-            console.print("[dim]No buildcache push output (command may have failed silently)[/dim]")
-
-        if result.stderr:
-            console.print(f"[yellow]Buildcache push stderr:\n{escape(result.stderr)}[/yellow]")
-
         console.print(f"[bold green]✓ Published to buildcache ({s3_mirror_url})[/bold green]")
         logger.debug(f"Successfully published to {s3_mirror_url}")
 
@@ -1074,6 +1101,78 @@ def _push_slurm_to_buildcache(
         raise SlurmFactoryError(msg)
 
 
+def _get_container_inputs_archive(files: dict[str, str]) -> bytes:
+    """
+    Pack generated build inputs into an uncompressed tar archive for ``docker cp -``.
+
+    ``docker cp`` without ``--archive`` ignores the archive's ownership, so the files land
+    owned by root; they are world-readable and only ever read by the build user.
+
+    Args:
+        files: Mapping of absolute container paths to file contents
+
+    Returns:
+        The tar archive as bytes, with member paths relative to the container root
+
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        for container_path, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(container_path.lstrip("/"))
+            info.size = len(data)
+            info.mode = 0o644
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def _get_build_scripts(
+    toolchain: str,
+    slurm_version: str,
+    build_namespace: str,
+    gpu_support: bool,
+    reuse_binaries: bool,
+) -> tuple[str, str]:
+    """
+    Generate the Spack build and tarball packaging scripts run for one build.
+
+    Args:
+        toolchain: OS toolchain identifier
+        slurm_version: Slurm version being built
+        build_namespace: Sanitized per-build namespace for container paths
+        gpu_support: Whether GPU support is enabled
+        reuse_binaries: Whether dependencies may be installed from a binary mirror
+
+    Returns:
+        Tuple of (Spack build script, tarball packaging script)
+
+    """
+    container_build_root = f"{CONTAINER_SLURM_DIR}/builds/{build_namespace}"
+    container_view_root = f"{container_build_root}/view"
+    slurm_build_script = get_slurm_build_script(
+        toolchain,
+        slurm_version,
+        view_root=container_view_root,
+        spack_stage_root=f"{CONTAINER_SPACK_STAGE_DIR}/{build_namespace}",
+        lmod_root=f"{container_build_root}/lmod",
+        reuse_binaries=reuse_binaries,
+    )
+    modulerc_script = get_modulerc_creation_script(
+        module_dir=f"{container_view_root}/assets/modules/slurm",
+        modulerc_path=f"{container_view_root}/assets/modules/slurm/.modulerc.lua",
+    )
+    create_slurm_tarball_script = get_create_slurm_tarball_script(
+        modulerc_script,
+        slurm_version,
+        toolchain,
+        _get_normalized_architecture(),
+        gpu_support,
+        install_tree_root=f"{container_build_root}/software",
+        view_root=container_view_root,
+    )
+    return slurm_build_script, create_slurm_tarball_script
+
+
 def _run_spack_build_in_container(
     container_name: str,
     base_image: str,
@@ -1084,6 +1183,7 @@ def _run_spack_build_in_container(
     gpu_support: bool,
     keep_container: bool = False,
     local_cache: str | None = None,
+    buildcache: bool = False,
 ) -> None:
     """
     Run the Spack build process inside a Docker container with mounted volumes.
@@ -1101,20 +1201,17 @@ def _run_spack_build_in_container(
         gpu_support: Whether GPU support is enabled
         keep_container: If True, don't remove container after build (for publishing)
         local_cache: Host path to local filesystem buildcache (bind-mounted into container)
+        buildcache: Whether the remote spack binary buildcache is configured as a mirror
 
     """
     console.print(f"[bold cyan]Running Spack build in container {container_name}...[/bold cyan]")
     logger.debug(f"Starting build container: {container_name}")
 
     build_namespace = _sanitize_build_namespace(container_name)
-    container_build_root = f"{CONTAINER_SLURM_DIR}/builds/{build_namespace}"
-    container_install_tree_root = f"{container_build_root}/software"
-    container_view_root = f"{container_build_root}/view"
     container_spack_stage_root = f"{CONTAINER_SPACK_STAGE_DIR}/{build_namespace}"
     container_spack_user_cache_root = f"{container_spack_stage_root}/user-cache"
     container_gnupg_root = f"{container_spack_user_cache_root}/gnupg"
     container_tmp_root = f"{container_spack_stage_root}/tmp"
-    container_lmod_root = f"{container_build_root}/lmod"
     host_uid = os.getuid()
     host_gid = os.getgid()
     container_user = "slurm-builder"
@@ -1131,26 +1228,12 @@ def _run_spack_build_in_container(
         logger.debug(f"Ensured directory exists: {dir_path}")
 
     # Generate build scripts
-    module_template_content = get_module_template_content()
-    slurm_build_script = get_slurm_build_script(
+    slurm_build_script, create_slurm_tarball_script = _get_build_scripts(
         toolchain,
         slurm_version,
-        view_root=container_view_root,
-        spack_stage_root=container_spack_stage_root,
-        lmod_root=container_lmod_root,
-    )
-    modulerc_script = get_modulerc_creation_script(
-        module_dir=f"{container_view_root}/assets/modules/slurm",
-        modulerc_path=f"{container_view_root}/assets/modules/slurm/.modulerc.lua",
-    )
-    create_slurm_tarball_script = get_create_slurm_tarball_script(
-        modulerc_script,
-        slurm_version,
-        toolchain,
-        _get_normalized_architecture(),
+        build_namespace,
         gpu_support,
-        install_tree_root=container_install_tree_root,
-        view_root=container_view_root,
+        reuse_binaries=buildcache or bool(local_cache),
     )
     debug_bundle_dir = _prepare_build_debug_bundle(
         settings=settings,
@@ -1162,22 +1245,17 @@ def _run_spack_build_in_container(
     )
 
     try:
-        # Write generated container inputs under the build cache root so large builds
-        # avoid /tmp-backed storage.
+        # Generated inputs are copied into the container as one tar stream after it starts
         console.print("[dim]Preparing configuration files...[/dim]")
-        container_inputs_dir = settings.home_cache_dir / "container-inputs" / build_namespace
-        container_inputs_dir.mkdir(parents=True, exist_ok=True)
-
-        spack_yaml_file = container_inputs_dir / "spack.yaml"
-        spack_yaml_file.write_text(spack_yaml)
-
-        # Write module template to a cache-rooted file for mounting
-        module_template_file = container_inputs_dir / "relocatable_modulefile.lua"
-        module_template_file.write_text(module_template_content)
-
-        # Write build script to a cache-rooted file for mounting
-        build_script_file = container_inputs_dir / "build-script.sh"
-        build_script_file.write_text(slurm_build_script)
+        container_inputs = _get_container_inputs_archive(
+            {
+                f"{CONTAINER_SPACK_PROJECT_DIR}/spack.yaml.mount": spack_yaml,
+                f"{CONTAINER_SPACK_TEMPLATES_DIR}/modules/relocatable_modulefile.lua": (
+                    get_module_template_content()
+                ),
+                f"{CONTAINER_SPACK_PROJECT_DIR}/build-script.sh": slurm_build_script,
+            },
+        )
 
         # Execute the Spack build script using docker run
         console.print("[bold cyan]Executing Spack build in container...[/bold cyan]")
@@ -1199,12 +1277,6 @@ def _run_spack_build_in_container(
             f"{spack_sourcecache_dir}:{CONTAINER_CACHE_DIR}/source",
             "-v",
             f"{tarball_build_output_dir}:{CONTAINER_BUILD_OUTPUT_DIR}",
-            "-v",
-            f"{spack_yaml_file}:{CONTAINER_SPACK_PROJECT_DIR}/spack.yaml.mount:ro",
-            "-v",
-            f"{module_template_file}:{CONTAINER_SPACK_TEMPLATES_DIR}/modules/relocatable_modulefile.lua",
-            "-v",
-            f"{build_script_file}:{CONTAINER_SPACK_PROJECT_DIR}/build-script.sh:ro",
             *(
                 ["-v", f"{local_cache}:{CONTAINER_LOCAL_BUILDCACHE_DIR}"]
                 if local_cache
@@ -1241,29 +1313,40 @@ def _run_spack_build_in_container(
         logger.debug(f"Starting container: {' '.join(build_script_cmd)}")
 
         subprocess.run(build_script_cmd, check=True, capture_output=True)
+        subprocess.run(
+            ["docker", "cp", "-", f"{container_name}:/"],
+            input=container_inputs,
+            check=True,
+            capture_output=True,
+        )
 
-        # Execute the build script in the running container
+        # Build and package in one exec; the build script's stdin is detached so it
+        # cannot consume the rest of the piped script.
+        build_and_package_script = (
+            f"/bin/bash {CONTAINER_SPACK_PROJECT_DIR}/build-script.sh </dev/null "
+            f"|| exit {SPACK_BUILD_FAILED_EXIT_CODE}\n"
+            "echo '✓ Spack build completed successfully'\n"
+            "echo 'Creating tarball package...'\n"
+            f"{create_slurm_tarball_script}\n"
+        )
         exec_build_cmd = [
             "docker",
             "exec",
+            "-i",
             "--user",
             f"{host_uid}:{host_gid}",
             container_name,
             "/bin/bash",
-            f"{CONTAINER_SPACK_PROJECT_DIR}/build-script.sh",
         ]
 
         result = subprocess.run(
             exec_build_cmd,
+            input=build_and_package_script,
+            text=True,
             check=False,  # Don't raise exception on non-zero exit
         )
 
-        # Clean up temp files
-        spack_yaml_file.unlink()
-        module_template_file.unlink()
-        build_script_file.unlink()
-
-        if result.returncode != 0:
+        if result.returncode == SPACK_BUILD_FAILED_EXIT_CODE:
             copied_files = _collect_spack_failure_debug_bundle(spack_stage_dir, debug_bundle_dir)
             console.print("[bold red]Spack build failed![/bold red]")
             console.print(f"[yellow]Container {container_name} has exited with errors[/yellow]")
@@ -1275,32 +1358,7 @@ def _run_spack_build_in_container(
             )
             raise SlurmFactoryError("Spack build failed")
 
-        console.print("[green]✓ Spack build completed successfully[/green]")
-
-        # Create tarball in the build container
-        console.print("[bold cyan]Creating tarball package...[/bold cyan]")
-        tarball_exec_cmd = [
-            "docker",
-            "exec",
-            "-i",
-            "--user",
-            f"{host_uid}:{host_gid}",
-            container_name,
-            "/bin/bash",
-        ]
-
-        process = subprocess.Popen(
-            tarball_exec_cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-
-        stdout, _ = process.communicate(input=create_slurm_tarball_script)
-        console.print(escape(stdout), end="")
-
-        if process.returncode != 0:
+        if result.returncode != 0:
             raise SlurmFactoryError("Failed to create tarball")
 
         console.print("[green]✓ Tarball created successfully[/green]")
@@ -1340,6 +1398,49 @@ def _run_spack_build_in_container(
         raise
 
 
+def prepare_base_image(settings: Settings, toolchain: str, slurm_version: str, no_cache: bool = False) -> str:
+    """
+    Build the shared base image for a toolchain, reusing an existing one unless no_cache is set.
+
+    Every build on a toolchain runs from the same content-addressed base image, so concurrent
+    builds must call this once up front and never remove the tag themselves.
+
+    Args:
+        settings: Application settings
+        toolchain: OS toolchain identifier
+        slurm_version: Slurm version the image is being prepared for
+        no_cache: Remove and rebuild the image without the Docker layer cache
+
+    Returns:
+        Tag of the ready base image
+
+    """
+    base_dockerfile_content = _get_slurm_base_dockerfile(operating_system=toolchain)
+    base_image_tag = _get_base_image_tag(toolchain, base_dockerfile_content)
+
+    if no_cache:
+        remove_old_docker_image(base_image_tag)
+    if not no_cache and docker_image_exists(base_image_tag):
+        console.print(f"[bold green]✓ Reusing existing base image {base_image_tag}[/bold green]")
+        return base_image_tag
+
+    console.print("[bold cyan]Building base Docker image (Ubuntu + Spack)...[/bold cyan]")
+    cache_from, cache_to = _get_base_image_cache_specs(settings, toolchain)
+    build_docker_image(
+        base_image_tag,
+        settings=settings,
+        dockerfile_content=base_dockerfile_content,
+        slurm_version=slurm_version,
+        toolchain=toolchain,
+        target="",  # No target for single-stage build
+        use_cache=not no_cache,
+        cache_from=cache_from,
+        cache_to=cache_to,
+    )
+    console.print(f"[bold green]✓ Base image complete (tagged as {base_image_tag})[/bold green]")
+    return base_image_tag
+
+
 def create_slurm_package(
     image_tag: str,
     settings: Settings,
@@ -1354,6 +1455,7 @@ def create_slurm_package(
     gpg_private_key: str | None = None,
     gpg_passphrase: str | None = None,
     local_cache: str | None = None,
+    base_image_prepared: bool = False,
 ) -> None:
     """Create slurm package in a Docker container using a multi-stage build."""
     console.print("[bold blue]Creating slurm package in Docker container...[/bold blue]")
@@ -1366,33 +1468,17 @@ def create_slurm_package(
 
     # Generate container and image names
     container_name = image_tag.replace(":", "-")  # Docker container names can't have ':'
-    base_image_tag = f"{image_tag}-base"
     build_namespace = _sanitize_build_namespace(container_name)
     container_build_root = f"{CONTAINER_SLURM_DIR}/builds/{build_namespace}"
     container_install_tree_root = f"{container_build_root}/software"
     container_view_root = f"{container_build_root}/view"
     container_spack_stage_root = f"{CONTAINER_SPACK_STAGE_DIR}/{build_namespace}"
-    container_source_cache_root = f"{container_spack_stage_root}/source-cache"
+    # Downloaded sources are checksum-named, so every build shares the host-mounted source cache
+    container_source_cache_root = f"{CONTAINER_CACHE_DIR}/source/downloads"
     container_misc_cache_root = f"{CONTAINER_CACHE_DIR}/source/misc/{build_namespace}"
     container_lmod_root = f"{container_build_root}/lmod"
 
     try:
-        console.print(
-            "[bold yellow]🗑️  Performing fresh build - cleaning old containers/images...[/bold yellow]"
-        )
-
-        # Remove old container if it exists
-        subprocess.run(
-            ["docker", "rm", "-f", container_name],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-
-        # Remove old Docker images
-        remove_old_docker_image(image_tag)
-        remove_old_docker_image(base_image_tag)
-
         # Always use Spack-built compiler for consistency and relocatability
         spack_yaml = generate_yaml_string(
             slurm_version=slurm_version,
@@ -1417,19 +1503,56 @@ def create_slurm_package(
             operating_system=toolchain,
         )
         logger.debug(f"Generated Dockerfile ({len(base_dockerfile_content)} chars)")
+        base_image_tag = _get_base_image_tag(toolchain, base_dockerfile_content)
 
-        # Build the base image
-        console.print("[bold cyan]Building base Docker image (Ubuntu + Spack)...[/bold cyan]")
-        build_docker_image(
+        # Skip the build entirely when identical inputs already produced the tarball.
+        # The per-build namespace is masked so reruns with a new container name still match.
+        tarball_build_output_dir = settings.builds_dir / toolchain / slurm_version
+        tarball_path = tarball_build_output_dir / _get_slurm_tarball_name(slurm_version, toolchain)
+        fingerprint_path = tarball_path.with_name(f"{tarball_path.name}.fingerprint")
+        slurm_build_script, create_slurm_tarball_script = _get_build_scripts(
+            toolchain,
+            slurm_version,
+            build_namespace,
+            gpu_support,
+            reuse_binaries=buildcache or bool(local_cache),
+        )
+        fingerprint = _get_build_fingerprint(
+            spack_yaml.replace(build_namespace, "<build>"),
             base_image_tag,
-            settings=settings,
-            dockerfile_content=base_dockerfile_content,
-            slurm_version=slurm_version,
-            toolchain=toolchain,
-            target="",  # No target for single-stage build
-            use_cache=False,  # Fresh build
+            slurm_build_script.replace(build_namespace, "<build>"),
+            create_slurm_tarball_script.replace(build_namespace, "<build>"),
+            get_module_template_content(),
+        )
+        if (
+            publish == "none"
+            and not no_cache
+            and tarball_path.exists()
+            and fingerprint_path.exists()
+            and fingerprint_path.read_text().strip() == fingerprint
+        ):
+            console.print(
+                f"[bold green]✓ {tarball_path.name} is up to date with these build inputs, "
+                "skipping build[/bold green]"
+            )
+            return
+        fingerprint_path.unlink(missing_ok=True)
+
+        console.print(
+            "[bold yellow]🗑️  Performing fresh build - cleaning old containers...[/bold yellow]"
         )
-        console.print(f"[bold green]✓ Base image complete (tagged as {base_image_tag})[/bold green]")
+
+        # Remove old container if it exists
+        subprocess.run(
+            ["docker", "rm", "-f", container_name],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        # The shared base image is left alone when the caller already prepared it
+        if not base_image_prepared:
+            prepare_base_image(settings, toolchain, slurm_version, no_cache=no_cache)
 
         # Check if we need to keep the container for publishing
         needs_publish = bool(
@@ -1450,59 +1573,50 @@ def create_slurm_package(
             gpu_support=gpu_support,
             keep_container=needs_publish,
             local_cache=local_cache,
+            buildcache=buildcache,
         )
-
-        # Calculate tarball output directory for publishing
-        tarball_build_output_dir = settings.builds_dir / toolchain / slurm_version
+        if tarball_path.exists():
+            fingerprint_path.write_text(f"{fingerprint}\n")
 
         # If publish is enabled, push to buildcache
         if (gpg_private_key and gpg_passphrase and signing_key) and publish in ("spack", "all"):
             console.print(f"[bold cyan]Publishing to buildcache ({publish})...[/bold cyan]")
 
-            # Commit the container to an image so we can use it with _push_slurm_to_buildcache
-            # Note: spack.yaml was copied into the container filesystem at build start,
-            # so it will be included in the committed image.
-            temp_image_tag = f"{image_tag}-temp"
-            console.print(
-                f"[dim]Committing container {container_name} to temporary image {temp_image_tag}...[/dim]"
-            )
-            commit_result = subprocess.run(
-                ["docker", "commit", container_name, temp_image_tag],
-                capture_output=True,
-                text=True,
-                timeout=DOCKER_COMMIT_TIMEOUT,
-            )
-            if commit_result.returncode != 0:
-                error_msg = commit_result.stderr.strip() or commit_result.stdout.strip() or "Unknown error"
-                raise SlurmFactoryError(f"Failed to commit container {container_name}: {error_msg}")
-
             try:
-                _push_slurm_to_buildcache(
-                    image_tag=temp_image_tag,
-                    slurm_version=slurm_version,
-                    toolchain=toolchain,
-                    signing_key=signing_key,
-                    gpg_private_key=gpg_private_key,
-                    gpg_passphrase=gpg_passphrase,
-                    local_cache=local_cache,
-                )
-
-                if publish == "all":
-                    console.print("[bold cyan]Signing and uploading tarball...[/bold cyan]")
-                    tarball_name = _get_slurm_tarball_name(slurm_version, toolchain)
-                    tarball_path = tarball_build_output_dir / tarball_name
-                    sign_and_push_tarball_to_buildcache(
-                        tarball_path=tarball_path,
-                        slurm_version=slurm_version,
-                        toolchain=toolchain,
-                        gpg_private_key=gpg_private_key,
-                        gpg_passphrase=gpg_passphrase,
-                        gpg_key_id=signing_key,
-                    )
+                # The buildcache push and the tarball upload are independent network-bound
+                # steps, so run them side by side.
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    publish_futures = [
+                        executor.submit(
+                            _push_slurm_to_buildcache,
+                            container_name=container_name,
+                            slurm_version=slurm_version,
+                            toolchain=toolchain,
+                            signing_key=signing_key,
+                            gpg_private_key=gpg_private_key,
+                            gpg_passphrase=gpg_passphrase,
+                            local_cache=local_cache,
+                        )
+                    ]
+
+                    if publish == "all":
+                        console.print("[bold cyan]Signing and uploading tarball...[/bold cyan]")
+                        publish_futures.append(
+                            executor.submit(
+                                sign_and_push_tarball_to_buildcache,
+                                container_name=container_name,
+                                tarball_path=tarball_path,
+                                slurm_version=slurm_version,
+                                toolchain=toolchain,
+                                gpg_private_key=gpg_private_key,
+                                gpg_passphrase=gpg_passphrase,
+                                gpg_key_id=signing_key,
+                            )
+                        )
+
+                    for future in publish_futures:
+                        future.result()
             finally:
-                # Clean up temporary image
-                console.print(f"[dim]Removing temporary image {temp_image_tag}...[/dim]")
-                remove_old_docker_image(temp_image_tag)
                 # Clean up the build container now that publishing is done
                 console.print(f"[dim]Removing build container {container_name}...[/dim]")
                 subprocess.run(
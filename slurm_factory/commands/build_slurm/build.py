@@ -14,60 +14,77 @@
 
 """Build Slurm package command."""
 
+import functools
 import logging
+import multiprocessing
+import os
+import secrets
 import subprocess
-import uuid
-from typing import Annotated
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Annotated, Any
 
 import typer
 from rich.console import Console
 from rich.markup import escape
 
-from slurm_factory.builders.slurm_builder import create_slurm_package
+from slurm_factory.builders.slurm_builder import create_slurm_package, prepare_base_image
+from slurm_factory.config import Settings
 from slurm_factory.constants import COMPILER_TOOLCHAINS, INSTANCE_NAME_PREFIX, SlurmVersion
 from slurm_factory.exceptions import SlurmFactoryError
 
 logger = logging.getLogger(__name__)
 
 
-def build_slurm(
-    ctx: typer.Context,
-    slurm_version: Annotated[
-        SlurmVersion, typer.Option("--slurm-version", help="Slurm version to build")
-    ] = SlurmVersion.v25_11,
-    toolchain: str = "noble",
-    gpu: bool = False,
-    verify: bool = False,
-    no_cache: bool = False,
-    publish: str = "none",
-    buildcache: bool = False,
-    enable_hierarchy: Annotated[
-        bool, typer.Option("--enable-hierarchy", help="Enable Core/Compiler/MPI module hierarchy")
-    ] = False,
-    signing_key: str | None = None,
-    gpg_private_key: str | None = None,
-    gpg_passphrase: str | None = None,
-    local_cache: str | None = None,
-):
-    """Build a specific Slurm version in a Docker container."""
-    console = Console()
+DOCKER_PROBE_STAMP = "docker-probe.ok"
+DOCKER_PROBE_TTL = 60  # seconds
+DOCKER_SOCKET = Path("/var/run/docker.sock")
 
-    # Initialize settings and ensure cache directories exist
-    settings = ctx.obj["settings"]
 
-    logger.debug(
-        f"Starting build with parameters: slurm_version={slurm_version.value}, "
-        f"toolchain={toolchain}, gpu={gpu}, verify={verify}, "
-        f"publish={publish}, enable_hierarchy={enable_hierarchy}"
-    )
+def _docker_probe_is_fresh(stamp: Path) -> bool:
+    """Return True if a successful probe was recorded within the TTL and the daemon socket is unchanged."""
+    try:
+        stamp_mtime = stamp.stat().st_mtime
+    except OSError:
+        return False
+    if time.time() - stamp_mtime >= DOCKER_PROBE_TTL:
+        return False
+    try:
+        # A restarted daemon recreates its socket, which invalidates the stamp
+        return DOCKER_SOCKET.stat().st_ctime <= stamp_mtime
+    except OSError:
+        # Without a local socket (rootless or remote DOCKER_HOST) a restart can't be detected
+        return False
 
-    settings.ensure_cache_dirs()
-    logger.debug(f"Ensured cache directories exist at {settings.home_cache_dir}")
 
-    # Check if Docker is available
+@functools.lru_cache(maxsize=1)
+def _ensure_docker_available(cache_dir: Path | None = None) -> None:
+    """
+    Verify that the Docker daemon is reachable.
+
+    A successful probe is cached for the lifetime of the process so repeated builds
+    skip the extra ``docker version`` round-trip. When cache_dir is given, success is
+    also recorded there for a short TTL so back-to-back CLI invocations skip it too.
+    Failures are never cached.
+
+    Args:
+        cache_dir: Optional slurm-factory cache directory holding the probe stamp
+
+    Raises:
+        SlurmFactoryError: If Docker is not installed, not running, or not responding
+
+    """
+    stamp = cache_dir / DOCKER_PROBE_STAMP if cache_dir else None
+    if stamp and _docker_probe_is_fresh(stamp):
+        logger.debug(f"Skipping Docker probe, recent success recorded in {stamp}")
+        return
+
+    console = Console()
     try:
         result = subprocess.run(
-            ["docker", "version"],
+            ["docker", "version", "--format", "{{.Server.Version}}"],
             capture_output=True,
             text=True,
             timeout=10,
@@ -84,16 +101,67 @@ def build_slurm(
         console.print("[bold red]Docker check timed out[/bold red]")
         logger.error("Docker version check timed out")
         raise SlurmFactoryError("Docker is not responding. Please check your Docker installation.")
+    logger.debug(f"Docker server version: {result.stdout.strip()}")
+
+    if stamp:
+        try:
+            tmp_stamp = stamp.with_suffix(f".{os.getpid()}")
+            tmp_stamp.write_text(result.stdout)
+            os.replace(tmp_stamp, stamp)
+        except OSError as e:
+            logger.debug(f"Could not record Docker probe in {stamp}: {e}")
+
+
+def _prepare_build(settings: Settings) -> None:
+    """Ensure the cache directories exist and Docker is reachable before building."""
+    settings.ensure_cache_dirs()
+    logger.debug(f"Ensured cache directories exist at {settings.home_cache_dir}")
+    _ensure_docker_available(settings.home_cache_dir)
+
+
+def _make_build_names(slurm_version: SlurmVersion) -> tuple[str, str]:
+    """Return a unique (container_name, image_tag) pair for one build of slurm_version."""
+    short_uuid = secrets.token_hex(4)
+    safe_version = slurm_version.safe
+    container_name = f"{INSTANCE_NAME_PREFIX}-{safe_version}-{short_uuid}"
+    image_tag = f"{INSTANCE_NAME_PREFIX}:build-{safe_version}-{short_uuid}"
+    return container_name, image_tag
+
+
+def build_slurm(
+    settings: Settings,
+    slurm_version: SlurmVersion = SlurmVersion.v25_11,
+    toolchain: str = "noble",
+    gpu: bool = False,
+    verify: bool = False,
+    no_cache: bool = False,
+    publish: str = "none",
+    buildcache: bool = False,
+    enable_hierarchy: bool = False,
+    signing_key: str | None = None,
+    gpg_private_key: str | None = None,
+    gpg_passphrase: str | None = None,
+    local_cache: str | None = None,
+    base_image_prepared: bool = False,
+):
+    """Build a specific Slurm version in a Docker container."""
+    console = Console()
+
+    logger.debug(
+        f"Starting build with parameters: slurm_version={slurm_version.value}, "
+        f"toolchain={toolchain}, gpu={gpu}, verify={verify}, "
+        f"publish={publish}, enable_hierarchy={enable_hierarchy}"
+    )
+
+    # Ensure cache directories exist and check if Docker is available
+    _prepare_build(settings)
 
     version = slurm_version.value
     console.print(f"Starting Slurm build process for version {version}")
     logger.debug(f"Building Slurm version {slurm_version.value}")
 
     # Generate unique container name for this build
-    short_uuid = f"{uuid.uuid4()}"[:8]
-    safe_version = version.replace(".", "-")
-    container_name = f"{INSTANCE_NAME_PREFIX}-{safe_version}-{short_uuid}"
-    image_tag = f"{INSTANCE_NAME_PREFIX}:build-{safe_version}-{short_uuid}"
+    container_name, image_tag = _make_build_names(slurm_version)
     logger.debug(f"Generated container name: {container_name}")
     logger.debug(f"Generated image tag: {image_tag}")
 
@@ -115,6 +183,7 @@ def build_slurm(
             gpg_private_key=gpg_private_key,
             gpg_passphrase=gpg_passphrase,
             local_cache=local_cache,
+            base_image_prepared=base_image_prepared,
         )
         logger.debug("Slurm package creation completed")
         console.print("[bold green]✓ Slurm package created successfully[/bold green]")
@@ -129,11 +198,101 @@ def build_slurm(
     console.print("[bold green]Build completed successfully![/bold green]")
 
 
+@dataclass(frozen=True)
+class BuildRequest:
+    """Picklable description of a single Slurm build dispatched to a worker process."""
+
+    settings: Settings
+    slurm_version: SlurmVersion
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+def _available_cpus() -> int:
+    """Return the number of CPUs this process may run on, honouring affinity/cgroup limits."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _build_slurm_worker(request: BuildRequest) -> str:
+    """Run build_slurm in a worker process and return the version that was built."""
+    build_slurm(request.settings, request.slurm_version, **request.options)
+    return request.slurm_version.value
+
+
+def build_many(
+    settings: Settings,
+    versions: list[SlurmVersion],
+    max_workers: int | None = None,
+    **options: Any,
+) -> list[str]:
+    """
+    Build several Slurm versions concurrently, one worker process per build.
+
+    Each build runs in its own uniquely named container. The toolchain's shared base
+    image is prepared once before the fan-out, so workers never build or remove it
+    concurrently. Workers are started with the ``spawn`` method so the pool behaves
+    the same on Linux and macOS.
+
+    Args:
+        settings: Application settings shared by every build
+        versions: Slurm versions to build
+        max_workers: Upper bound on concurrent builds (defaults to min(len(versions), CPUs, 16))
+        **options: Keyword arguments forwarded to build_slurm (toolchain, gpu, publish, ...)
+
+    Returns:
+        The versions that were built, in completion order
+
+    Raises:
+        SlurmFactoryError: If any build fails; the first failure is re-raised and
+            builds that have not started are cancelled
+
+    """
+    if not versions:
+        return []
+
+    if max_workers is None:
+        max_workers = min(len(versions), _available_cpus(), 16)
+    logger.debug(f"Building {len(versions)} Slurm versions with {max_workers} workers")
+
+    # Docker is probed once here so workers fail fast on a broken daemon
+    _prepare_build(settings)
+    prepare_base_image(
+        settings,
+        options.get("toolchain", "noble"),
+        versions[0].value,
+        no_cache=options.get("no_cache", False),
+    )
+    options = {**options, "base_image_prepared": True}
+
+    requests = [BuildRequest(settings, version, options) for version in versions]
+    built: list[str] = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {executor.submit(_build_slurm_worker, request): request for request in requests}
+        for future in as_completed(futures):
+            try:
+                built.append(future.result())
+            except BaseException:
+                # Any failure, including a broken pool, stops builds that have not started yet
+                for pending in futures:
+                    pending.cancel()
+                raise
+
+    return built
+
+
 def build_slurm_command(
     ctx: typer.Context,
     slurm_version: Annotated[
-        SlurmVersion, typer.Option("--slurm-version", help="Slurm version to build")
-    ] = SlurmVersion.v25_11,
+        list[SlurmVersion] | None,
+        typer.Option(
+            "--slurm-version",
+            help="Slurm version to build; repeat to build several versions in parallel",
+        ),
+    ] = None,
     toolchain: Annotated[
         str,
         typer.Option(
@@ -244,6 +403,7 @@ def build_slurm_command(
     Examples:
         slurm-factory build-slurm                                    # Build default (25.11, noble)
         slurm-factory build-slurm --slurm-version 24.11             # Build specific version
+        slurm-factory build-slurm --slurm-version 25.11 --slurm-version 24.11  # Build both in parallel
         slurm-factory build-slurm --toolchain jammy                 # Build for Ubuntu 22.04
         slurm-factory build-slurm --toolchain rockylinux10          # Build for Rocky Linux 10
         slurm-factory build-slurm --toolchain rockylinux9           # Build for Rocky Linux 9
@@ -258,6 +418,7 @@ def build_slurm_command(
 
     """
     console = Console()
+    slurm_versions = list(dict.fromkeys(slurm_version or [SlurmVersion.v25_11]))
 
     # Validate publish parameter
     valid_publish_options = ["none", "spack", "all"]
@@ -272,37 +433,40 @@ def build_slurm_command(
         console.print(f"[bold yellow]Available toolchains: {available}[/bold yellow]")
         raise typer.Exit(1)
 
-    # Show toolchain info
+    # Show toolchain info and build options in a single write
     os_name, gcc_ver, glibc_ver, base_image, _ = COMPILER_TOOLCHAINS[toolchain]
-    console.print(
+    status_lines = [
         f"[bold blue]Building with toolchain:[/bold blue] "
-        f"{os_name} (GCC {gcc_ver}, glibc {glibc_ver}, {base_image})"
-    )
-
-    console.print(f"[bold green]Starting build for Slurm {slurm_version}[/bold green]")
+        f"{os_name} (GCC {gcc_ver}, glibc {glibc_ver}, {base_image})",
+        f"[bold green]Starting build for Slurm {', '.join(v.value for v in slurm_versions)}[/bold green]",
+    ]
     if no_cache:
-        console.print("[bold yellow]Building with --no-cache (fresh build)[/bold yellow]")
+        status_lines.append("[bold yellow]Building with --no-cache (fresh build)[/bold yellow]")
 
     if publish != "none":
-        console.print(f"[bold cyan]Will publish to buildcache: {publish}[/bold cyan]")
+        status_lines.append(f"[bold cyan]Will publish to buildcache: {publish}[/bold cyan]")
         if signing_key:
-            console.print(f"[bold blue]Using GPG signing key: {signing_key}[/bold blue]")
+            status_lines.append(f"[bold blue]Using GPG signing key: {signing_key}[/bold blue]")
 
     if enable_hierarchy:
-        console.print("[bold cyan]Enabling Core/Compiler/MPI module hierarchy[/bold cyan]")
-
-    build_slurm(
-        ctx,
-        slurm_version,
-        toolchain,
-        gpu,
-        verify,
-        no_cache,
-        publish,
-        buildcache,
-        enable_hierarchy,
-        signing_key,
-        gpg_private_key,
-        gpg_passphrase,
-        local_cache,
-    )
+        status_lines.append("[bold cyan]Enabling Core/Compiler/MPI module hierarchy[/bold cyan]")
+    console.print("\n".join(status_lines))
+
+    options: dict[str, Any] = {
+        "toolchain": toolchain,
+        "gpu": gpu,
+        "verify": verify,
+        "no_cache": no_cache,
+        "publish": publish,
+        "buildcache": buildcache,
+        "enable_hierarchy": enable_hierarchy,
+        "signing_key": signing_key,
+        "gpg_private_key": gpg_private_key,
+        "gpg_passphrase": gpg_passphrase,
+        "local_cache": local_cache,
+    }
+    settings = ctx.obj["settings"]
+    if len(slurm_versions) == 1:
+        build_slurm(settings, slurm_versions[0], **options)
+    else:
+        build_many(settings, slurm_versions, **options)
@@ -33,6 +33,11 @@ class Settings:
             return Path(cache_dir).expanduser()
         return Path.home() / ".slurm-factory"
 
+    @property
+    def docker_cache_ref(self) -> str | None:
+        """Get the registry image used as a shared BuildKit cache, if configured."""
+        return os.environ.get("SLURM_FACTORY_DOCKER_CACHE_REF") or None
+
     @property
     def builds_dir(self) -> Path:
         """Get the ~/.slurm-factory/builds directory."""
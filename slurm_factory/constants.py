@@ -40,6 +40,7 @@ yum update -y && yum install -y \
     gcc-c++ \
     gcc-gfortran \
     glibc-devel \
+    gnupg2 \
     make \
     wget \
     tar \
@@ -56,12 +57,12 @@ yum update -y && yum install -y \
     unzip \
     findutils \
     diffutils \
+    pigz \
     kernel-headers \
     lbzip2 \
     sssd-client
 # Set python3.9 as the default python3 (re2c and other tools need Python 3.7+)
 alternatives --set python3 /usr/bin/python3.9
-yum clean all && rm -rf /var/cache/yum
 PIP_BREAK_SYSTEM_PACKAGES=1 pip3 install boto3
 """
 
@@ -80,6 +81,7 @@ yum update -y && yum install -y \
     gcc-c++ \
     gcc-gfortran \
     glibc-devel \
+    gnupg2 \
     make \
     wget \
     tar \
@@ -96,10 +98,10 @@ yum update -y && yum install -y \
     unzip \
     findutils \
     diffutils \
+    pigz \
     kernel-headers \
     lbzip2 \
     sssd-client
-yum clean all && rm -rf /var/cache/yum
 PIP_BREAK_SYSTEM_PACKAGES=1 pip3 install boto3
 """
 
@@ -136,11 +138,11 @@ yum update -y && yum install -y \
     unzip \
     findutils \
     diffutils \
+    pigz \
     kernel-headers \
     bzip2 \
     bzip2-libs \
     sssd-client
-yum clean all && rm -rf /var/cache/yum
 PIP_BREAK_SYSTEM_PACKAGES=1 pip3 install boto3
 """
 
@@ -158,6 +160,7 @@ apt-get install -y \
     gfortran \
     lmod \
     ca-certificates \
+    gnupg \
     python3 \
     python3-pip \
     patch \
@@ -166,9 +169,9 @@ apt-get install -y \
     gzip \
     xz-utils \
     diffutils \
-    libnss-sss && \
-    apt-get clean && rm -rf /var/lib/apt/lists/*
-    PIP_BREAK_SYSTEM_PACKAGES=1 pip3 install boto3
+    pigz \
+    libnss-sss
+PIP_BREAK_SYSTEM_PACKAGES=1 pip3 install boto3
 """
 
 UBUNTU_RESOLUTE_SETUP_SCRIPT = """
@@ -189,6 +192,7 @@ apt-get install -y \
     gfortran \
     lmod \
     ca-certificates \
+    gnupg \
     python3 \
     python3-pip \
     patch \
@@ -197,6 +201,7 @@ apt-get install -y \
     gzip \
     xz-utils \
     diffutils \
+    pigz \
     gnu-coreutils \
     libxml2-16 \
     libnss-sss \
@@ -214,7 +219,6 @@ rm -f /usr/bin/dd && ln -s /usr/bin/gnudd /usr/bin/dd
 # CUDA installer is built against libxml2.so.2, but Ubuntu 26.04 has libxml2.so.16
 ln -sf /usr/lib/x86_64-linux-gnu/libxml2.so.16 /usr/lib/x86_64-linux-gnu/libxml2.so.2
 
-apt-get clean && rm -rf /var/lib/apt/lists/*
 PIP_BREAK_SYSTEM_PACKAGES=1 pip3 install boto3
 """
 
@@ -276,6 +280,14 @@ class SlurmVersion(str, Enum):
     v24_11 = "24.11"
     v23_11 = "23.11"
 
+    @property
+    def safe(self) -> str:
+        """Version with dots replaced by dashes, safe for Docker names and tags."""
+        return _SAFE_SLURM_VERSIONS[self]
+
+
+_SAFE_SLURM_VERSIONS = {version: version.value.replace(".", "-") for version in SlurmVersion}
+
 
 class BuildType(str, Enum):
     """Build type options for Slurm."""
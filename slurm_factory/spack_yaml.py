@@ -350,7 +350,8 @@ def generate_spack_config(
                 "checksum": True,
                 "deprecated": False,
                 # Spack 1.x performance enhancements
-                "build_jobs": 4,  # Parallel build jobs
+                # build_jobs is left unset so Spack uses min(16, cores) of the build container;
+                # the host generating this file cannot know the container's core count
                 "ccache": False,  # Disabled - system ccache incompatible with Spack-built compilers
                 "connect_timeout": 30,  # Network timeout for downloads
                 "verify_ssl": True,  # Security setting
@@ -14,8 +14,9 @@
 
 """Utils used throughout the slurm-factory package."""
 
+import functools
 import logging
-import shutil
+import os
 import subprocess
 import sys
 import textwrap
@@ -32,34 +33,6 @@ logger = logging.getLogger(__name__)
 console = Console()
 
 
-def get_data_dir() -> Path:
-    """
-    Get the path to the data directory.
-
-    When installed as a wheel, data files are in share/slurm-factory/
-    When running from source, data files are in data/ at the repository root.
-
-    Returns
-    -------
-        Path to the data directory
-
-    """
-    # Try installed location first (sys.prefix/share/slurm-factory/)
-    installed_data = Path(sys.prefix) / "share" / "slurm-factory"
-    if installed_data.exists():
-        logger.debug(f"Using installed data directory: {installed_data}")
-        return installed_data
-
-    # Fall back to development/source location (repo_root/data/)
-    package_dir = Path(__file__).parent.parent
-    source_data = package_dir / "data"
-    if source_data.exists():
-        logger.debug(f"Using source data directory: {source_data}")
-        return source_data
-
-    raise FileNotFoundError(f"Could not find data directory. Tried:\n  - {installed_data}\n  - {source_data}")
-
-
 def build_docker_image(
     image_tag: str,
     settings: Settings,
@@ -68,6 +41,8 @@ def build_docker_image(
     toolchain: str,
     target: str,
     use_cache: bool = False,
+    cache_from: str | None = None,
+    cache_to: str | None = None,
 ) -> None:
     """
     Build a Docker image from a Dockerfile string.
@@ -80,6 +55,8 @@ def build_docker_image(
         toolchain: OS toolchain identifier (e.g., "noble", "jammy")
         target: Build target stage in multi-stage builds (e.g., "builder")
         use_cache: If True, allow Docker to use build cache
+        cache_from: Optional BuildKit cache source (e.g. "type=registry,ref=<image>:cache")
+        cache_to: Optional BuildKit cache export (e.g. "type=registry,ref=<image>:cache,mode=max")
 
     """
     console.print(f"[bold blue]Building Docker image {image_tag}...[/bold blue]")
@@ -98,55 +75,38 @@ def build_docker_image(
 
     process = None
     try:
-        # Find the repository root (where pyproject.toml is located)
-
-        # Start from current directory and search upwards for pyproject.toml
-        current_dir = Path.cwd()
-        repo_root = current_dir
-        while repo_root != repo_root.parent:
-            if (repo_root / "pyproject.toml").exists():
-                break
-            repo_root = repo_root.parent
-
-        # If pyproject.toml not found, fallback to current directory
-        if not (repo_root / "pyproject.toml").exists():
-            repo_root = current_dir
-            logger.warning(f"Could not find repository root, using current directory: {repo_root}")
-        else:
-            logger.debug(f"Using repository root as build context: {repo_root}")
-
-        # Ensure data files are available in the build context
-        # If running from installed wheel, copy data files to build context
-        data_source = get_data_dir()
-        data_target = repo_root / "data"
-
-        if data_source != data_target:
-            logger.debug(f"Staging data files from {data_source} to {data_target}")
-
-            if data_target.exists():
-                shutil.rmtree(data_target)
-            shutil.copytree(data_source, data_target)
-
         spack_stage_user_local = settings.spack_stage_dir / slurm_version / toolchain
         logger.debug(f"Using Spack stage dir for build: {spack_stage_user_local}")
         spack_stage_user_local.mkdir(parents=True, exist_ok=True)
-        # Use docker build with stdin for the Dockerfile
+
+        # Add --no-cache flag for fresh builds and to reduce issues caused by caching in build environments
+        if not use_cache:
+            cache_args = ["--no-cache"]
+        elif cache_from:
+            # Seed the build from a shared cache; the local layer cache is used regardless
+            cache_args = ["--cache-from", cache_from]
+        else:
+            cache_args = []
+
+        # Export the layer cache even for --no-cache builds so later builds can reuse it.
+        # Cache export needs buildx; --load keeps the result in the local image store.
+        build_cmd = ["build"]
+        if cache_to:
+            build_cmd = ["buildx", "build", "--load"]
+            cache_args = ["--cache-to", cache_to, *cache_args]
+
+        # Read the Dockerfile from stdin without a build context: the generated Dockerfiles
+        # COPY nothing, so there is no directory to stage or transfer to the builder
         # Enable BuildKit for better caching and features
         cmd = [
             "docker",
-            "build",
+            *build_cmd,
+            *cache_args,
             "-t",
             image_tag,
-            "--rm=false",  # Preserve containers on build failure for debugging
-            "-f",
-            "-",  # Read Dockerfile from stdin
-            str(repo_root),  # Build context - use repository root so COPY paths work
+            "-",
         ]
 
-        # Add --no-cache flag for fresh builds and to reduce issues caused by caching in build environments
-        if not use_cache:
-            cmd.insert(2, "--no-cache")
-
         # Add --target flag if specified
         if target:
             cmd.extend(["--target", target])
@@ -162,6 +122,13 @@ def build_docker_image(
             stderr=subprocess.STDOUT,  # Merge stderr into stdout
             text=True,
             bufsize=1,  # Line buffered
+            # Plain, untruncated BuildKit progress so every step is a full line
+            env={
+                **os.environ,
+                "DOCKER_BUILDKIT": "1",
+                "BUILDKIT_PROGRESS": "plain",
+                "PROGRESS_NO_TRUNC": "1",
+            },
         )
 
         # Write Dockerfile to stdin
@@ -172,15 +139,13 @@ def build_docker_image(
         # Stream output line by line
         # Use sys.stdout.write() instead of console.print() to avoid any buffering/limits
         if process.stdout:
-            import sys
-
             for line in process.stdout:
                 line = line.rstrip()
                 if line:
                     # Direct write to stdout to avoid any buffering or size limits
                     sys.stdout.write(f"  {line}\n")
                     sys.stdout.flush()
-                    logger.debug(f"Docker build: {line}")
+                    logger.debug("Docker build: %s", line)
 
         # Wait for process to complete
         # Increased timeout to 4 hours (14400s) for large Spack builds with GPU support
@@ -190,27 +155,6 @@ def build_docker_image(
             msg = f"Docker image build failed with exit code {returncode}"
             logger.error(msg)
             console.print(f"[bold red]{msg}[/bold red]")
-
-            # Try to find the failed build container for debugging
-            result = subprocess.run(
-                ["docker", "ps", "-a", "-q", "-l"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if result.stdout.strip():
-                failed_container = result.stdout.strip()
-                console.print("[yellow]💡 Debug tip: Access build logs from failed container:[/yellow]")
-                console.print(f"[dim]  docker start {failed_container}[/dim]")
-                console.print(f"[dim]  docker exec -it {failed_container} bash[/dim]")
-                console.print(
-                    "[dim]  # Inside: cat /opt/spack-stage/root/spack-stage-*/spack-build-out.txt[/dim]"
-                )
-                console.print(
-                    f"[dim]  # Or: docker cp {failed_container}:/opt/spack-stage ./spack-stage[/dim]"
-                )
-
             raise SlurmFactoryError(msg)
 
         console.print(f"[bold green]✓ Docker image {image_tag} built successfully[/bold green]")
@@ -230,6 +174,30 @@ def build_docker_image(
         raise SlurmFactoryError(msg)
 
 
+def docker_image_exists(image_tag: str) -> bool:
+    """
+    Check whether a Docker image with the given tag exists locally.
+
+    Args:
+        image_tag: Tag of the image to look up
+
+    Returns:
+        True if the image exists, False otherwise
+
+    """
+    try:
+        result = subprocess.run(
+            ["docker", "image", "inspect", "--format", "{{.Id}}", image_tag],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except Exception as e:
+        logger.warning(f"Could not inspect Docker image {image_tag}: {e}")
+        return False
+    return result.returncode == 0
+
+
 def remove_old_docker_image(image_tag: str) -> None:
     """
     Remove an old Docker image if it exists.
@@ -273,6 +241,7 @@ def remove_old_docker_image(image_tag: str) -> None:
         console.print(f"[dim]Warning: Could not remove old image: {escape(str(e))}[/dim]")
 
 
+@functools.lru_cache(maxsize=1)
 def get_install_spack_script() -> str:
     """Generate script to install Spack."""
     return textwrap.dedent(
@@ -283,6 +252,7 @@ def get_install_spack_script() -> str:
     ).strip()
 
 
+@functools.lru_cache(maxsize=1)
 def get_create_spack_profile_script() -> str:
     """Generate script to set up Spack profile."""
     return textwrap.dedent("""\
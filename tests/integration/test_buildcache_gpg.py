@@ -20,7 +20,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from slurm_factory.builders.slurm_builder import DOCKER_DNS_SERVERS, _push_slurm_to_buildcache
+from slurm_factory.builders.slurm_builder import _push_slurm_to_buildcache
 from slurm_factory.exceptions import SlurmFactoryError
 
 # Create alias for the test
@@ -60,7 +60,7 @@ class TestGPGKeyImport:
 
             # Call the function with GPG key
             push_to_buildcache(
-                image_tag="test:latest",
+                container_name="slurm-factory-build-test",
                 slurm_version="25.11",
                 toolchain="noble",
                 signing_key="0xTESTKEY",
@@ -75,13 +75,10 @@ class TestGPGKeyImport:
             call_args = mock_run.call_args
             cmd = call_args[0][0]
 
-            # Verify docker run command structure
-            assert "docker" in cmd
-            assert "run" in cmd
-            assert "--rm" in cmd
-            for dns_server in DOCKER_DNS_SERVERS:
-                dns_server_index = cmd.index(dns_server)
-                assert cmd[dns_server_index - 1] == "--dns"
+            # Verify docker exec command structure against the running build container
+            assert cmd[:2] == ["docker", "exec"]
+            assert cmd[cmd.index("--user") + 1] == f"{os.getuid()}:{os.getgid()}"
+            assert "slurm-factory-build-test" in cmd
 
             # Verify GPG key is passed as environment variable
             assert any("GPG_PRIVATE_KEY" in arg for arg in cmd)
@@ -109,7 +106,7 @@ class TestGPGKeyImport:
 
             # Call the function without GPG key
             push_to_buildcache(
-                image_tag="test:latest",
+                container_name="slurm-factory-build-test",
                 slurm_version="25.11",
                 toolchain="noble",
                 signing_key=None,
@@ -127,6 +124,28 @@ class TestGPGKeyImport:
             assert "allow-loopback-pinentry" not in bash_script
             assert "--unsigned" in bash_script
 
+    def test_unsigned_push_skips_key_import(self, mock_gpg_key, mock_gpg_passphrase, mock_aws_env):
+        """Test that an available GPG key is not imported when packages are pushed unsigned."""
+        with patch.dict(os.environ, mock_aws_env), patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+            push_to_buildcache(
+                container_name="slurm-factory-build-test",
+                slurm_version="25.11",
+                toolchain="noble",
+                signing_key=None,
+                gpg_private_key=mock_gpg_key,
+                gpg_passphrase=mock_gpg_passphrase,
+            )
+
+            cmd = mock_run.call_args[0][0]
+            bash_script = cmd[-1]
+
+            assert f"GPG_PRIVATE_KEY={mock_gpg_key}" not in cmd
+            assert f"GPG_PASSPHRASE={mock_gpg_passphrase}" not in cmd
+            assert "gpg-real" not in bash_script
+            assert "--unsigned" in bash_script
+
     def test_gpg_agent_kill_and_restart(self, mock_gpg_key, mock_gpg_passphrase, mock_aws_env):
         """Test that GPG agent is killed and restarted to ensure clean configuration state."""
         with patch.dict(os.environ, mock_aws_env), patch("subprocess.run") as mock_run:
@@ -135,7 +154,7 @@ class TestGPGKeyImport:
 
             # Call the function with GPG key
             push_to_buildcache(
-                image_tag="test:latest",
+                container_name="slurm-factory-build-test",
                 slurm_version="25.11",
                 toolchain="noble",
 
@@ -167,7 +186,7 @@ class TestGPGKeyImport:
 
             # Call the function with specific signing key
             push_to_buildcache(
-                image_tag="test:latest",
+                container_name="slurm-factory-build-test",
                 slurm_version="25.11",
                 toolchain="noble",
 
@@ -192,7 +211,7 @@ class TestGPGKeyImport:
 
             # Call the function with GPG key
             push_to_buildcache(
-                image_tag="test:latest",
+                container_name="slurm-factory-build-test",
                 slurm_version="25.11",
                 toolchain="noble",
 
@@ -254,7 +273,7 @@ class TestGPGErrorHandling:
             # Should raise SlurmFactoryError with appropriate message
             with pytest.raises(SlurmFactoryError) as exc_info:
                 push_to_buildcache(
-                    image_tag="test:latest",
+                    container_name="slurm-factory-build-test",
                     slurm_version="25.11",
                     toolchain="noble",
                     signing_key="0xTESTKEY",
@@ -274,7 +293,7 @@ class TestGPGErrorHandling:
             # Should raise SlurmFactoryError about missing credentials
             with pytest.raises(SlurmFactoryError) as exc_info:
                 push_to_buildcache(
-                    image_tag="test:latest",
+                    container_name="slurm-factory-build-test",
                     slurm_version="25.11",
                     toolchain="noble",
                     signing_key="0xTESTKEY",
@@ -119,6 +119,13 @@ class TestEnhancedRPATH:
         # ccache is disabled because system ccache is incompatible with Spack-built compilers
         assert spack_config["ccache"] is False
 
+    def test_build_jobs_not_pinned(self):
+        """Test that per-package build parallelism is left to Spack's core-count default."""
+        config = generate_spack_config()
+        spack_config = config["spack"]["config"]
+
+        assert "build_jobs" not in spack_config
+
     def test_additional_config_options(self):
         """Test additional Spack 1.x config options."""
         config = generate_spack_config()
@@ -0,0 +1,244 @@
+# Copyright 2025 Vantage Compute Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the build-slurm command module."""
+
+import os
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import call, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from slurm_factory.commands.build_slurm import build
+from slurm_factory.config import Settings
+from slurm_factory.constants import SlurmVersion
+from slurm_factory.exceptions import SlurmFactoryError
+from slurm_factory.main import app
+
+
+class InlineExecutor:
+    """Executor stand-in that runs the first ``run_limit`` submissions inline and leaves the rest pending."""
+
+    instances: list["InlineExecutor"] = []
+
+    def __init__(self, max_workers=None, mp_context=None, run_limit=None):
+        """Record the pool arguments; ``run_limit`` of None runs every submission."""
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self.run_limit = run_limit
+        self.futures: list[Future] = []
+        InlineExecutor.instances.append(self)
+
+    def __enter__(self):
+        """Return the executor itself, like a real pool."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Do not suppress exceptions raised inside the ``with`` block."""
+        return False
+
+    def submit(self, fn, *args):
+        """Run fn inline while under ``run_limit`` and return its future; later submissions stay pending."""
+        future: Future = Future()
+        if self.run_limit is None or len(self.futures) < self.run_limit:
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+        self.futures.append(future)
+        return future
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """Settings rooted in a temporary cache directory."""
+    with patch.dict("os.environ", {"SLURM_FACTORY_CACHE_DIR": str(tmp_path)}):
+        yield Settings(project_name="test")
+
+
+@pytest.fixture(autouse=True)
+def no_docker_probe():
+    """Skip the Docker availability check."""
+    InlineExecutor.instances.clear()
+    with patch.object(build, "_prepare_build") as mock_prepare:
+        yield mock_prepare
+
+
+@pytest.fixture(autouse=True)
+def mock_prepare_base_image():
+    """Skip building the shared base image."""
+    with patch.object(build, "prepare_base_image") as mock_prepare:
+        yield mock_prepare
+
+
+class TestDockerProbeStamp:
+    """Test the cross-invocation Docker probe stamp."""
+
+    @pytest.fixture
+    def socket(self, tmp_path):
+        """A stand-in Docker socket created before the stamp."""
+        path = tmp_path / "docker.sock"
+        path.touch()
+        with patch.object(build, "DOCKER_SOCKET", path):
+            yield path
+
+    def test_fresh_stamp_skips_probe(self, tmp_path, socket):
+        """A recent stamp newer than the socket is fresh."""
+        stamp = tmp_path / build.DOCKER_PROBE_STAMP
+        stamp.write_text("27.0.0")
+
+        # Socket ctime cannot be backdated, so compare against a stamp written after it
+        with patch.object(build.time, "time", return_value=stamp.stat().st_mtime + 1):
+            assert build._docker_probe_is_fresh(stamp) is True
+
+    def test_missing_stamp_is_not_fresh(self, tmp_path, socket):
+        """Without a recorded probe the daemon must be checked."""
+        assert build._docker_probe_is_fresh(tmp_path / build.DOCKER_PROBE_STAMP) is False
+
+    def test_expired_stamp_is_not_fresh(self, tmp_path, socket):
+        """A stamp older than the TTL is ignored."""
+        stamp = tmp_path / build.DOCKER_PROBE_STAMP
+        stamp.write_text("27.0.0")
+
+        with patch.object(build.time, "time", return_value=stamp.stat().st_mtime + build.DOCKER_PROBE_TTL):
+            assert build._docker_probe_is_fresh(stamp) is False
+
+    def test_socket_newer_than_stamp_is_not_fresh(self, tmp_path, socket):
+        """A daemon restart after the probe invalidates the stamp."""
+        stamp = tmp_path / build.DOCKER_PROBE_STAMP
+        stamp.write_text("27.0.0")
+        old = stamp.stat().st_mtime - 10
+        os.utime(stamp, (old, old))
+
+        with patch.object(build.time, "time", return_value=old + 1):
+            assert build._docker_probe_is_fresh(stamp) is False
+
+    def test_missing_socket_is_not_fresh(self, tmp_path):
+        """Rootless or remote daemons can't be checked for restarts, so the stamp is not trusted."""
+        stamp = tmp_path / build.DOCKER_PROBE_STAMP
+        stamp.write_text("27.0.0")
+
+        with (
+            patch.object(build, "DOCKER_SOCKET", tmp_path / "missing.sock"),
+            patch.object(build.time, "time", return_value=stamp.stat().st_mtime + 1),
+        ):
+            assert build._docker_probe_is_fresh(stamp) is False
+
+
+class TestBuildMany:
+    """Test concurrent multi-version builds."""
+
+    @patch.object(build, "ProcessPoolExecutor", InlineExecutor)
+    @patch.object(build, "build_slurm")
+    def test_options_are_forwarded_to_each_build(self, mock_build_slurm, settings):
+        """Every version is built with the same keyword options."""
+        built = build.build_many(
+            settings,
+            [SlurmVersion.v25_11, SlurmVersion.v24_11],
+            toolchain="jammy",
+            gpu=True,
+            publish="spack",
+        )
+
+        assert sorted(built) == ["24.11", "25.11"]
+        options = {"toolchain": "jammy", "gpu": True, "publish": "spack", "base_image_prepared": True}
+        assert mock_build_slurm.call_args_list == [
+            call(settings, SlurmVersion.v25_11, **options),
+            call(settings, SlurmVersion.v24_11, **options),
+        ]
+
+    @patch.object(build, "ProcessPoolExecutor", InlineExecutor)
+    @patch.object(build, "build_slurm")
+    def test_base_image_is_prepared_once_before_fan_out(
+        self, mock_build_slurm, mock_prepare_base_image, settings
+    ):
+        """The shared base image is built once, so --no-cache workers never race on its tag."""
+        mock_prepare_base_image.side_effect = lambda *args, **kwargs: mock_build_slurm.assert_not_called()
+
+        build.build_many(
+            settings, [SlurmVersion.v25_11, SlurmVersion.v24_11], toolchain="jammy", no_cache=True
+        )
+
+        mock_prepare_base_image.assert_called_once_with(settings, "jammy", "25.11", no_cache=True)
+        assert all(c.kwargs["base_image_prepared"] for c in mock_build_slurm.call_args_list)
+
+    @patch.object(
+        build,
+        "ProcessPoolExecutor",
+        lambda max_workers, mp_context: InlineExecutor(max_workers, mp_context, run_limit=1),
+    )
+    @patch.object(build, "build_slurm", side_effect=SlurmFactoryError("boom"))
+    def test_failure_cancels_pending_builds(self, mock_build_slurm, settings):
+        """The first failure is re-raised and builds that have not started are cancelled."""
+        with pytest.raises(SlurmFactoryError, match="boom"):
+            build.build_many(settings, [SlurmVersion.v25_11, SlurmVersion.v24_11, SlurmVersion.v23_11])
+
+        executor = InlineExecutor.instances[-1]
+        assert mock_build_slurm.call_count == 1
+        assert [future.cancelled() for future in executor.futures] == [False, True, True]
+
+    @patch.object(
+        build,
+        "ProcessPoolExecutor",
+        lambda max_workers, mp_context: InlineExecutor(max_workers, mp_context, run_limit=1),
+    )
+    @patch.object(build, "build_slurm", side_effect=BrokenProcessPool("worker died"))
+    def test_unexpected_failure_cancels_pending_builds(self, mock_build_slurm, settings):
+        """Failures other than SlurmFactoryError also cancel builds that have not started."""
+        with pytest.raises(BrokenProcessPool):
+            build.build_many(settings, [SlurmVersion.v25_11, SlurmVersion.v24_11, SlurmVersion.v23_11])
+
+        executor = InlineExecutor.instances[-1]
+        assert [future.cancelled() for future in executor.futures] == [False, True, True]
+
+    @patch.object(build, "ProcessPoolExecutor", InlineExecutor)
+    @patch.object(build, "build_slurm")
+    @patch.object(build, "_available_cpus", return_value=2)
+    def test_worker_count_is_capped_by_available_cpus(self, mock_cpus, mock_build_slurm, settings):
+        """The pool is no larger than the CPUs this process may use."""
+        build.build_many(settings, [SlurmVersion.v25_11, SlurmVersion.v24_11, SlurmVersion.v23_11])
+
+        mock_cpus.assert_called_once_with()
+        assert InlineExecutor.instances[-1].max_workers == 2
+        assert InlineExecutor.instances[-1].mp_context.get_start_method() == "spawn"
+
+
+class TestBuildSlurmCommand:
+    """Test version dispatch in the build-slurm CLI."""
+
+    @patch.object(build, "build_many")
+    @patch.object(build, "build_slurm")
+    def test_single_version_builds_in_process(self, mock_build_slurm, mock_build_many):
+        """One --slurm-version runs a single build directly."""
+        result = CliRunner().invoke(app, ["build-slurm", "--slurm-version", "24.11"])
+
+        assert result.exit_code == 0, result.output
+        mock_build_many.assert_not_called()
+        assert mock_build_slurm.call_args.args[1] == SlurmVersion.v24_11
+
+    @patch.object(build, "build_many")
+    @patch.object(build, "build_slurm")
+    def test_repeated_versions_build_in_parallel(self, mock_build_slurm, mock_build_many):
+        """Several --slurm-version options fan out through build_many."""
+        result = CliRunner().invoke(
+            app,
+            ["build-slurm", "--slurm-version", "25.11", "--slurm-version", "24.11", "--toolchain", "jammy"],
+        )
+
+        assert result.exit_code == 0, result.output
+        mock_build_slurm.assert_not_called()
+        assert mock_build_many.call_args.args[1] == [SlurmVersion.v25_11, SlurmVersion.v24_11]
+        assert mock_build_many.call_args.kwargs["toolchain"] == "jammy"
@@ -14,6 +14,8 @@
 
 """Unit tests for slurm_factory.builders module."""
 
+import io
+import tarfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -69,6 +71,15 @@ class TestSlurmBuilderModule:
         assert "spack -e . install -j $(nproc)" not in script
         assert "share/spack/lmod" not in script
 
+    def test_build_script_reuses_binary_mirrors_when_configured(self):
+        """Concretization should only use --fresh when no binary mirror is available."""
+        fresh_script = slurm_builder.get_slurm_build_script("noble", "26.05")
+        reuse_script = slurm_builder.get_slurm_build_script("noble", "26.05", reuse_binaries=True)
+
+        assert "spack -e . concretize -j $(nproc) -f --fresh" in fresh_script
+        assert "--fresh" not in reuse_script
+        assert "spack -e . concretize -j $(nproc) -f\n" in reuse_script
+
     def test_build_script_removes_dependency_loads_from_redistributable_modules(self):
         """Tarball modulefiles should not require dependency modulefiles absent from the tarball."""
         script = slurm_builder.get_slurm_build_script("noble", "26.05")
@@ -78,6 +89,7 @@ class TestSlurmBuilderModule:
         assert 'rm -f "$module_file.bak"' in script
 
     @patch("slurm_factory.builders.slurm_builder.subprocess.run")
+    @patch("slurm_factory.builders.slurm_builder.docker_image_exists", return_value=False)
     @patch("slurm_factory.builders.slurm_builder.remove_old_docker_image")
     @patch("slurm_factory.builders.slurm_builder.build_docker_image")
     @patch("slurm_factory.builders.slurm_builder._run_spack_build_in_container")
@@ -88,6 +100,7 @@ class TestSlurmBuilderModule:
         mock_run_spack_build,
         mock_build_docker_image,
         mock_remove_old_docker_image,
+        mock_docker_image_exists,
         mock_subprocess_run,
         tmp_path: Path,
     ):
@@ -112,17 +125,220 @@ class TestSlurmBuilderModule:
         assert yaml_kwargs["install_tree_root"] == f"{expected_build_root}/software"
         assert yaml_kwargs["view_root"] == f"{expected_build_root}/view"
         assert yaml_kwargs["build_stage_root"] == f"/opt/spack-stage/{expected_namespace}"
-        assert yaml_kwargs["source_cache_root"] == f"/opt/spack-stage/{expected_namespace}/source-cache"
+        assert yaml_kwargs["source_cache_root"] == "/opt/slurm-factory-cache/source/downloads"
         assert yaml_kwargs["misc_cache_root"] == f"/opt/slurm-factory-cache/source/misc/{expected_namespace}"
         assert yaml_kwargs["lmod_root"] == f"{expected_build_root}/lmod"
         assert yaml_kwargs["architecture"] == slurm_builder._get_normalized_architecture()
 
         mock_build_docker_image.assert_called_once()
         mock_run_spack_build.assert_called_once()
-        mock_remove_old_docker_image.assert_any_call("slurm-factory:build-26-05-abc12345")
-        mock_remove_old_docker_image.assert_any_call("slurm-factory:build-26-05-abc12345-base")
+        base_image_tag = mock_build_docker_image.call_args.args[0]
+        assert base_image_tag.startswith("slurm-factory:base-noble-")
+        assert mock_run_spack_build.call_args.kwargs["base_image"] == base_image_tag
+
+    @patch("slurm_factory.builders.slurm_builder.subprocess.run")
+    @patch("slurm_factory.builders.slurm_builder.docker_image_exists", return_value=True)
+    @patch("slurm_factory.builders.slurm_builder.remove_old_docker_image")
+    @patch("slurm_factory.builders.slurm_builder.build_docker_image")
+    @patch("slurm_factory.builders.slurm_builder._run_spack_build_in_container")
+    @patch("slurm_factory.builders.slurm_builder.generate_yaml_string", return_value="spack:\n  specs: []\n")
+    def test_create_slurm_package_reuses_existing_base_image(
+        self,
+        mock_generate_yaml_string,
+        mock_run_spack_build,
+        mock_build_docker_image,
+        mock_remove_old_docker_image,
+        mock_docker_image_exists,
+        mock_subprocess_run,
+        tmp_path: Path,
+    ):
+        """An existing base image for the toolchain should be reused instead of rebuilt."""
+        mock_subprocess_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+        with patch.dict("os.environ", {"SLURM_FACTORY_CACHE_DIR": str(tmp_path)}):
+            settings = Settings(project_name="test")
+            slurm_builder.create_slurm_package(
+                image_tag="slurm-factory:build-26-05-abc12345",
+                settings=settings,
+                slurm_version="26.05",
+                toolchain="noble",
+            )
+
+        mock_build_docker_image.assert_not_called()
+        base_image_tag = mock_docker_image_exists.call_args.args[0]
+        assert base_image_tag == slurm_builder._get_base_image_tag(
+            "noble", slurm_builder._get_slurm_base_dockerfile(operating_system="noble")
+        )
+        assert mock_run_spack_build.call_args.kwargs["base_image"] == base_image_tag
+
+    @patch("slurm_factory.builders.slurm_builder.subprocess.run")
+    @patch("slurm_factory.builders.slurm_builder.docker_image_exists", return_value=False)
+    @patch("slurm_factory.builders.slurm_builder.remove_old_docker_image")
+    @patch("slurm_factory.builders.slurm_builder.build_docker_image")
+    @patch("slurm_factory.builders.slurm_builder._run_spack_build_in_container")
+    def test_create_slurm_package_leaves_prepared_base_image_alone(
+        self,
+        mock_run_spack_build,
+        mock_build_docker_image,
+        mock_remove_old_docker_image,
+        mock_docker_image_exists,
+        mock_subprocess_run,
+        tmp_path: Path,
+    ):
+        """A build whose base image was prepared up front never removes or rebuilds the shared tag."""
+        mock_subprocess_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+        with patch.dict("os.environ", {"SLURM_FACTORY_CACHE_DIR": str(tmp_path)}):
+            slurm_builder.create_slurm_package(
+                image_tag="slurm-factory:build-26-05-abc12345",
+                settings=Settings(project_name="test"),
+                slurm_version="26.05",
+                toolchain="noble",
+                no_cache=True,
+                base_image_prepared=True,
+            )
+
+        mock_remove_old_docker_image.assert_not_called()
+        mock_build_docker_image.assert_not_called()
+        base_image_tag = slurm_builder._get_base_image_tag(
+            "noble", slurm_builder._get_slurm_base_dockerfile(operating_system="noble")
+        )
+        assert mock_run_spack_build.call_args.kwargs["base_image"] == base_image_tag
 
-    @patch("slurm_factory.builders.slurm_builder.get_module_template_content", return_value="template")
+    @patch("slurm_factory.builders.slurm_builder.subprocess.run")
+    @patch("slurm_factory.builders.slurm_builder.docker_image_exists", return_value=True)
+    @patch("slurm_factory.builders.slurm_builder.remove_old_docker_image")
+    @patch("slurm_factory.builders.slurm_builder.build_docker_image")
+    @patch("slurm_factory.builders.slurm_builder._run_spack_build_in_container")
+    def test_create_slurm_package_skips_build_when_fingerprint_matches(
+        self,
+        mock_run_spack_build,
+        mock_build_docker_image,
+        mock_remove_old_docker_image,
+        mock_docker_image_exists,
+        mock_subprocess_run,
+        tmp_path: Path,
+    ):
+        """A rerun with unchanged inputs should reuse the existing tarball, even with a new build name."""
+        mock_subprocess_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+        with patch.dict("os.environ", {"SLURM_FACTORY_CACHE_DIR": str(tmp_path)}):
+            settings = Settings(project_name="test")
+            tarball_dir = settings.builds_dir / "noble" / "26.05"
+            tarball_dir.mkdir(parents=True)
+            (tarball_dir / slurm_builder._get_slurm_tarball_name("26.05", "noble")).write_bytes(b"tarball")
+
+            for image_tag in ("slurm-factory:build-26-05-aaaa1111", "slurm-factory:build-26-05-bbbb2222"):
+                slurm_builder.create_slurm_package(
+                    image_tag=image_tag,
+                    settings=settings,
+                    slurm_version="26.05",
+                    toolchain="noble",
+                )
+            assert mock_run_spack_build.call_count == 1
+            # The skipped rerun must not touch Docker at all
+            assert mock_subprocess_run.call_count == 1
+            mock_remove_old_docker_image.assert_not_called()
+            assert mock_docker_image_exists.call_count == 1
+
+            slurm_builder.create_slurm_package(
+                image_tag="slurm-factory:build-26-05-cccc3333",
+                settings=settings,
+                slurm_version="26.05",
+                toolchain="noble",
+                gpu_support=True,
+            )
+            assert mock_run_spack_build.call_count == 2
+
+    @patch("slurm_factory.builders.slurm_builder.subprocess.run")
+    @patch("slurm_factory.builders.slurm_builder.docker_image_exists", return_value=True)
+    @patch("slurm_factory.builders.slurm_builder.remove_old_docker_image")
+    @patch("slurm_factory.builders.slurm_builder.build_docker_image")
+    @patch("slurm_factory.builders.slurm_builder._run_spack_build_in_container")
+    def test_create_slurm_package_rebuilds_when_tarball_script_changes(
+        self,
+        mock_run_spack_build,
+        mock_build_docker_image,
+        mock_remove_old_docker_image,
+        mock_docker_image_exists,
+        mock_subprocess_run,
+        tmp_path: Path,
+    ):
+        """A change to the packaging step should invalidate the fingerprint stamp."""
+        mock_subprocess_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+        with patch.dict("os.environ", {"SLURM_FACTORY_CACHE_DIR": str(tmp_path)}):
+            settings = Settings(project_name="test")
+            tarball_dir = settings.builds_dir / "noble" / "26.05"
+            tarball_dir.mkdir(parents=True)
+            (tarball_dir / slurm_builder._get_slurm_tarball_name("26.05", "noble")).write_bytes(b"tarball")
+
+            for image_tag in ("slurm-factory:build-26-05-aaaa1111", "slurm-factory:build-26-05-bbbb2222"):
+                slurm_builder.create_slurm_package(
+                    image_tag=image_tag,
+                    settings=settings,
+                    slurm_version="26.05",
+                    toolchain="noble",
+                )
+            assert mock_run_spack_build.call_count == 1
+
+            with patch(
+                "slurm_factory.builders.slurm_builder.get_create_slurm_tarball_script",
+                return_value="echo 'changed packaging'",
+            ):
+                slurm_builder.create_slurm_package(
+                    image_tag="slurm-factory:build-26-05-cccc3333",
+                    settings=settings,
+                    slurm_version="26.05",
+                    toolchain="noble",
+                )
+            assert mock_run_spack_build.call_count == 2
+
+    @patch("slurm_factory.builders.slurm_builder.subprocess.run")
+    @patch("slurm_factory.builders.slurm_builder.docker_image_exists", return_value=True)
+    @patch("slurm_factory.builders.slurm_builder.remove_old_docker_image")
+    @patch("slurm_factory.builders.slurm_builder._run_spack_build_in_container")
+    @patch("slurm_factory.builders.slurm_builder.sign_and_push_tarball_to_buildcache")
+    @patch("slurm_factory.builders.slurm_builder._push_slurm_to_buildcache")
+    def test_create_slurm_package_publishes_buildcache_and_tarball(
+        self,
+        mock_push_to_buildcache,
+        mock_sign_and_push_tarball,
+        mock_run_spack_build,
+        mock_remove_old_docker_image,
+        mock_docker_image_exists,
+        mock_subprocess_run,
+        tmp_path: Path,
+    ):
+        """Publishing should reuse the running build container for both uploads, then remove it."""
+        mock_subprocess_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+        with patch.dict("os.environ", {"SLURM_FACTORY_CACHE_DIR": str(tmp_path)}):
+            settings = Settings(project_name="test")
+            slurm_builder.create_slurm_package(
+                image_tag="slurm-factory:build-26-05-abc12345",
+                settings=settings,
+                slurm_version="26.05",
+                toolchain="noble",
+                publish="all",
+                signing_key="0xKEYID",
+                gpg_private_key="a2V5",
+                gpg_passphrase="passphrase",
+            )
+
+        container_name = "slurm-factory-build-26-05-abc12345"
+        mock_push_to_buildcache.assert_called_once()
+        assert mock_push_to_buildcache.call_args.kwargs["container_name"] == container_name
+        mock_sign_and_push_tarball.assert_called_once()
+        assert mock_sign_and_push_tarball.call_args.kwargs["container_name"] == container_name
+        docker_cmds = [call.args[0] for call in mock_subprocess_run.call_args_list]
+        assert not any(cmd[:2] == ["docker", "commit"] for cmd in docker_cmds)
+        assert ["docker", "rm", "-f", container_name] in docker_cmds
+
+    @patch(
+        "slurm_factory.builders.slurm_builder.get_module_template_content",
+        return_value="-- module template",
+    )
     @patch("slurm_factory.builders.slurm_builder.subprocess.run")
     def test_run_spack_build_mounts_namespaced_stage_and_cache_env(
         self,
@@ -133,13 +349,14 @@ class TestSlurmBuilderModule:
         """The live Docker container should receive per-build Spack stage/cache paths."""
         mock_subprocess_run.side_effect = [
             Mock(returncode=0, stdout="", stderr=""),
-            Mock(returncode=1, stdout="", stderr=""),
+            Mock(returncode=0, stdout="", stderr=""),
+            Mock(returncode=slurm_builder.SPACK_BUILD_FAILED_EXIT_CODE, stdout="", stderr=""),
         ]
 
         with patch.dict("os.environ", {"SLURM_FACTORY_CACHE_DIR": str(tmp_path)}):
             settings = Settings(project_name="test")
 
-            with pytest.raises(SlurmFactoryError):
+            with pytest.raises(SlurmFactoryError, match="Spack build failed"):
                 slurm_builder._run_spack_build_in_container(
                     container_name="slurm-factory-build-26-05-abc12345",
                     base_image="slurm-factory:build-26-05-abc12345-base",
@@ -151,22 +368,106 @@ class TestSlurmBuilderModule:
                 )
 
         docker_run_cmd = mock_subprocess_run.call_args_list[0].args[0]
-        exec_build_cmd = mock_subprocess_run.call_args_list[1].args[0]
+        copy_inputs_call = mock_subprocess_run.call_args_list[1]
+        exec_build_call = mock_subprocess_run.call_args_list[2]
         expected_namespace = "slurm-factory-build-26-05-abc12345"
         expected_stage_mount = f"{tmp_path}/spack-stage/noble/26.05:/opt/spack-stage"
-        expected_inputs_dir = f"{tmp_path}/container-inputs/{expected_namespace}"
 
         assert expected_stage_mount in docker_run_cmd
-        assert f"{expected_inputs_dir}/spack.yaml:/root/spack-project/spack.yaml.mount:ro" in docker_run_cmd
+        assert copy_inputs_call.args[0] == ["docker", "cp", "-", f"{expected_namespace}:/"]
+        with tarfile.open(fileobj=io.BytesIO(copy_inputs_call.kwargs["input"])) as archive:
+            inputs = {member.name: archive.extractfile(member).read().decode() for member in archive}
+        assert inputs["root/spack-project/spack.yaml.mount"] == "spack:\n  specs: []\n"
         assert (
-            f"{expected_inputs_dir}/build-script.sh:/root/spack-project/build-script.sh:ro"
-            in docker_run_cmd
+            inputs["opt/spack/share/spack/templates/modules/relocatable_modulefile.lua"]
+            == "-- module template"
         )
+        assert "root/spack-project/build-script.sh" in inputs
         for dns_server in slurm_builder.DOCKER_DNS_SERVERS:
             dns_server_index = docker_run_cmd.index(dns_server)
             assert docker_run_cmd[dns_server_index - 1] == "--dns"
-        assert "/root/spack-project/build-script.sh" in exec_build_cmd
+        assert exec_build_call.args[0][:3] == ["docker", "exec", "-i"]
+        assert "/root/spack-project/build-script.sh" in exec_build_call.kwargs["input"]
         assert f"SPACK_USER_CACHE_PATH=/opt/spack-stage/{expected_namespace}/user-cache" in docker_run_cmd
         assert f"TMPDIR=/opt/spack-stage/{expected_namespace}/tmp" in docker_run_cmd
         assert f"TMP=/opt/spack-stage/{expected_namespace}/tmp" in docker_run_cmd
         assert f"TEMP=/opt/spack-stage/{expected_namespace}/tmp" in docker_run_cmd
+
+    @patch("slurm_factory.builders.slurm_builder.subprocess.run")
+    def test_sign_and_push_tarball_execs_in_build_container(self, mock_subprocess_run, tmp_path: Path):
+        """Tarball signing and upload should run in the build container, not a new image."""
+        mock_subprocess_run.return_value = Mock(returncode=0, stdout="published", stderr="")
+        tarball_path = tmp_path / "slurm-26.05-noble-amd64-software.tar.gz"
+        tarball_path.write_text("tarball")
+
+        with patch.dict("os.environ", {"AWS_ACCESS_KEY_ID": "key", "AWS_SECRET_ACCESS_KEY": "secret"}):
+            slurm_builder.sign_and_push_tarball_to_buildcache(
+                container_name="slurm-factory-build-26-05-abc12345",
+                tarball_path=tarball_path,
+                slurm_version="26.05",
+                toolchain="noble",
+                gpg_private_key="a2V5",
+                gpg_passphrase="passphrase",
+                gpg_key_id="0xKEYID",
+            )
+
+        mock_subprocess_run.assert_called_once()
+        exec_cmd = mock_subprocess_run.call_args.args[0]
+        sign_script = mock_subprocess_run.call_args.kwargs["input"]
+        assert exec_cmd[:2] == ["docker", "exec"]
+        assert exec_cmd[-2:] == ["slurm-factory-build-26-05-abc12345", "/bin/bash"]
+        assert "AWS_ACCESS_KEY_ID=key" in exec_cmd
+        assert f"/opt/slurm/build_output/{tarball_path.name}" in sign_script
+        assert "--detach-sign" in sign_script
+        assert 'rm -rf "$SIGN_DIR"' in sign_script
+
+    @patch("slurm_factory.builders.slurm_builder._buildx_can_export_cache", return_value=True)
+    def test_base_image_cache_specs(self, mock_can_export, tmp_path: Path):
+        """A registry cache ref wins over the GitHub Actions cache, which needs the runtime token."""
+        gha_env = {"ACTIONS_CACHE_URL": "https://cache.example/", "ACTIONS_RUNTIME_TOKEN": "token"}
+        with patch.dict("os.environ", {"SLURM_FACTORY_CACHE_DIR": str(tmp_path)}, clear=True):
+            settings = Settings(project_name="test")
+            assert slurm_builder._get_base_image_cache_specs(settings, "noble") == (None, None)
+
+            with patch.dict("os.environ", gha_env):
+                assert slurm_builder._get_base_image_cache_specs(settings, "noble") == (
+                    "type=gha,scope=slurm-base-noble",
+                    "type=gha,scope=slurm-base-noble,mode=max",
+                )
+
+                with patch.dict("os.environ", {"SLURM_FACTORY_DOCKER_CACHE_REF": "ghcr.io/org/cache"}):
+                    assert slurm_builder._get_base_image_cache_specs(settings, "noble") == (
+                        "type=registry,ref=ghcr.io/org/cache:base-noble",
+                        "type=registry,ref=ghcr.io/org/cache:base-noble,mode=max",
+                    )
+
+    @patch("slurm_factory.builders.slurm_builder._buildx_can_export_cache", return_value=False)
+    def test_base_image_cache_specs_without_exporting_builder(self, mock_can_export, tmp_path: Path):
+        """The default docker driver gets no cache export and no Actions cache import."""
+        gha_env = {"ACTIONS_CACHE_URL": "https://cache.example/", "ACTIONS_RUNTIME_TOKEN": "token"}
+        with patch.dict("os.environ", {"SLURM_FACTORY_CACHE_DIR": str(tmp_path), **gha_env}, clear=True):
+            settings = Settings(project_name="test")
+            assert slurm_builder._get_base_image_cache_specs(settings, "noble") == (None, None)
+
+            with patch.dict("os.environ", {"SLURM_FACTORY_DOCKER_CACHE_REF": "ghcr.io/org/cache"}):
+                assert slurm_builder._get_base_image_cache_specs(settings, "noble") == (
+                    "type=registry,ref=ghcr.io/org/cache:base-noble",
+                    None,
+                )
+
+    @pytest.mark.parametrize(
+        ("stdout", "expected"),
+        [
+            ("Name:   builder\nDriver: docker-container\n", True),
+            ("Name:   default\nDriver: docker\n", False),
+        ],
+    )
+    @patch("slurm_factory.builders.slurm_builder.subprocess.run")
+    def test_buildx_can_export_cache(self, mock_run, stdout, expected):
+        """Only non-default buildx drivers can export a cache."""
+        mock_run.return_value = Mock(returncode=0, stdout=stdout, stderr="")
+        slurm_builder._buildx_can_export_cache.cache_clear()
+        try:
+            assert slurm_builder._buildx_can_export_cache() is expected
+        finally:
+            slurm_builder._buildx_can_export_cache.cache_clear()
@@ -75,6 +75,15 @@ class TestSettings:
         assert settings.build_debug_dir == expected_path
         assert isinstance(settings.build_debug_dir, Path)
 
+    def test_docker_cache_ref_property(self):
+        """Test docker_cache_ref property reads the environment."""
+        settings = Settings(project_name="test")
+
+        with patch.dict("os.environ", {"SLURM_FACTORY_DOCKER_CACHE_REF": "ghcr.io/org/slurm-factory-cache"}):
+            assert settings.docker_cache_ref == "ghcr.io/org/slurm-factory-cache"
+        with patch.dict("os.environ", {"SLURM_FACTORY_DOCKER_CACHE_REF": ""}):
+            assert settings.docker_cache_ref is None
+
     def test_all_cache_dirs_under_home_cache(self):
         """Test that all cache directories are under home_cache_dir."""
         settings = Settings(project_name="test")
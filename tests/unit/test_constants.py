@@ -89,6 +89,11 @@ class TestSlurmVersion:
         assert SlurmVersion.v24_11 == "24.11"
         assert SlurmVersion.v23_11 == "23.11"
 
+    def test_slurm_version_safe(self):
+        """Test the Docker-safe form of SlurmVersion."""
+        assert SlurmVersion.v25_11.safe == "25-11"
+        assert all("." not in version.safe for version in SlurmVersion)
+
 
 class TestContainerPaths:
     """Test container path constants."""
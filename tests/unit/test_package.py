@@ -0,0 +1,46 @@
+# Copyright 2025 Vantage Compute Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the slurm_factory package's lazy public attributes."""
+
+import importlib
+
+import pytest
+
+import slurm_factory
+
+
+@pytest.mark.parametrize("name", sorted(slurm_factory._LAZY_ATTRS))
+def test_lazy_attribute_resolves(name):
+    """Every lazily exported name resolves to the object in its defining module."""
+    slurm_factory.__dict__.pop(name, None)
+
+    value = getattr(slurm_factory, name)
+
+    module = importlib.import_module(slurm_factory._LAZY_ATTRS[name])
+    assert value is getattr(module, name)
+
+
+def test_version_resolves():
+    """__version__ resolves to a non-empty string."""
+    slurm_factory.__dict__.pop("__version__", None)
+
+    assert isinstance(slurm_factory.__version__, str)
+    assert slurm_factory.__version__
+
+
+def test_all_names_resolve():
+    """Every name in __all__ is reachable, including via from-imports."""
+    for name in slurm_factory.__all__:
+        assert getattr(slurm_factory, name) is not None
@@ -38,3 +38,16 @@ class TestSlurmBaseDockerfile:
         assert 'python_for_spack="${SPACK_PYTHON:-$(command -v python3)}"' in dockerfile
         assert 'PIP_BREAK_SYSTEM_PACKAGES=1 "$python_for_spack" -m pip install boto3' in dockerfile
         assert '"$python_for_spack" -c "import boto3"' in dockerfile
+
+    def test_package_downloads_use_cache_mounts(self):
+        """System package and pip downloads persist in BuildKit cache mounts, not image layers."""
+        ubuntu = _get_slurm_base_dockerfile("noble")
+        rocky = _get_slurm_base_dockerfile("rockylinux9")
+
+        assert "--mount=type=cache,id=apt-cache-noble,target=/var/cache/apt,sharing=locked" in ubuntu
+        assert "rm -f /etc/apt/apt.conf.d/docker-clean" in ubuntu
+        assert "apt-get clean" not in ubuntu
+        assert "--mount=type=cache,id=dnf-rockylinux9,target=/var/cache/dnf,sharing=locked" in rocky
+        assert "keepcache=1" in rocky
+        assert "yum clean all" not in rocky
+        assert "--mount=type=cache,id=pip-noble,target=/root/.cache/pip" in ubuntu
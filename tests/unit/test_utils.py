@@ -14,6 +14,8 @@
 
 """Unit tests for slurm_factory.utils module."""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 
@@ -58,7 +60,6 @@ class TestModuleStructure:
         
         # Test for existence of key functions
         expected_functions = [
-            'get_data_dir',
             'build_docker_image',
             'remove_old_docker_image',
             'get_install_spack_script',
@@ -79,5 +80,52 @@ class TestModuleStructure:
             pytest.fail(f"Failed to import utils module: {e}")
 
 
+
+class TestBuildDockerImage:
+    """Test the docker build command assembled by build_docker_image."""
+
+    def _build(self, tmp_path, returncode=0, **kwargs):
+        from slurm_factory import utils
+        from slurm_factory.config import Settings
+
+        process = MagicMock()
+        process.stdout = iter(["#1 done\n"])
+        process.wait.return_value = returncode
+        with (
+            patch.dict("os.environ", {"SLURM_FACTORY_CACHE_DIR": str(tmp_path)}),
+            patch("slurm_factory.utils.subprocess.Popen", return_value=process) as mock_popen,
+        ):
+            utils.build_docker_image(
+                "slurm-factory:base-noble-abc",
+                settings=Settings(project_name="test"),
+                dockerfile_content="FROM scratch\n",
+                slurm_version="25.11",
+                toolchain="noble",
+                target="",
+                **kwargs,
+            )
+        return mock_popen.call_args.args[0]
+
+    def test_cached_build_does_not_seed_from_its_own_tag(self, tmp_path):
+        """The content-addressed tag cannot exist yet, so it must not be used as a cache source."""
+        cmd = self._build(tmp_path, use_cache=True)
+
+        assert cmd == ["docker", "build", "-t", "slurm-factory:base-noble-abc", "-"]
+
+    def test_shared_cache_source_is_passed_through(self, tmp_path):
+        """A configured shared cache is the only --cache-from source."""
+        cmd = self._build(tmp_path, use_cache=True, cache_from="type=registry,ref=example/cache:base-noble")
+
+        assert cmd[cmd.index("--cache-from") + 1] == "type=registry,ref=example/cache:base-noble"
+        assert cmd.count("--cache-from") == 1
+        assert "--rm=false" not in cmd
+
+    def test_failed_build_raises_slurm_factory_error(self, tmp_path):
+        """Build failures stay catchable as SlurmFactoryError."""
+        from slurm_factory.exceptions import SlurmFactoryError
+
+        with pytest.raises(SlurmFactoryError, match="exit code 1"):
+            self._build(tmp_path, returncode=1)
+
 if __name__ == "__main__":
     pytest.main([__file__])